@@ -30,10 +30,15 @@ def run_command(cmd, description):
         return False
 
 
-def install_dev():
-    """Install package in development mode."""
-    return run_command([sys.executable, "-m", "pip", "install", "-e", ".[dev]"], 
-                      "Installing package in development mode")
+def install_dev(extra_packages=()):
+    """Install package in development mode.
+
+    Extra packages are folded into the same pip invocation so callers never
+    pay for a second pip startup.
+    """
+    return run_command(
+        [sys.executable, "-m", "pip", "install", "-e", ".[dev]", *extra_packages],
+        "Installing package in development mode")
 
 
 def run_tests():
@@ -64,12 +69,13 @@ def type_check():
                       "Type checking with mypy")
 
 
-def build_package():
+def build_package(install_tools=True):
     """Build the package."""
     success = True
-    success &= run_command([sys.executable, "-m", "pip", "install", "build"], 
-                          "Installing build tools")
-    success &= run_command([sys.executable, "-m", "build"], 
+    if install_tools:
+        success &= run_command([sys.executable, "-m", "pip", "install", "build"],
+                              "Installing build tools")
+    success &= run_command([sys.executable, "-m", "build"],
                           "Building package")
     return success
 
@@ -132,11 +138,13 @@ def main():
         success = clean()
     elif args.command == "all":
         success = True
-        success &= install_dev()
+        # One pip invocation installs everything the chain needs, so the
+        # later steps skip their own pip calls
+        success &= install_dev(extra_packages=["build"])
         success &= format_code()
         success &= lint_code()
         success &= run_tests()
-        success &= build_package()
+        success &= build_package(install_tools=False)
     
     if success:
         print(f"\n✅ {args.command.capitalize()} completed successfully!")
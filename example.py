@@ -109,40 +109,42 @@ def demonstrate_cli_usage(inp_file):
     print("\n" + "="*50)
     print("CLI Demonstration")
     print("="*50)
-    
-    import subprocess
-    import sys
-    
+
+    # Invoke the Click commands in-process: no interpreter startup or
+    # click/rich re-import per call, unlike spawning `python -m pyseesabq`
+    from click.testing import CliRunner
+
+    from pyseesabq.cli import cli
+
+    runner = CliRunner()
+
     try:
         # Show version
         print("\n1. Checking version:")
-        result = subprocess.run([sys.executable, "-m", "pyseesabq", "--version"], 
-                              capture_output=True, text=True)
-        print(f"   {result.stdout.strip()}")
-        
+        result = runner.invoke(cli, ["--version"])
+        print(f"   {result.output.strip()}")
+
         # Show file info
         print("\n2. Getting file information:")
-        result = subprocess.run([sys.executable, "-m", "pyseesabq", "info", str(inp_file)], 
-                              capture_output=True, text=True)
-        if result.returncode == 0:
-            print("   " + result.stdout.replace('\n', '\n   '))
+        result = runner.invoke(cli, ["info", str(inp_file)])
+        if result.exit_code == 0:
+            print("   " + result.output.replace('\n', '\n   '))
         else:
-            print(f"   Error: {result.stderr}")
-        
+            print(f"   Error: {result.output}")
+
         # Convert file
         print("\n3. Converting file:")
         output_file = inp_file.with_suffix('.converted.py')
-        result = subprocess.run([
-            sys.executable, "-m", "pyseesabq", "convert", 
-            str(inp_file), "-o", str(output_file), "--verbose"
-        ], capture_output=True, text=True)
-        
-        if result.returncode == 0:
-            print("   " + result.stdout.replace('\n', '\n   '))
+        result = runner.invoke(cli, [
+            "convert", str(inp_file), "-o", str(output_file), "--verbose"
+        ])
+
+        if result.exit_code == 0:
+            print("   " + result.output.replace('\n', '\n   '))
             print(f"   Generated: {output_file}")
         else:
-            print(f"   Error: {result.stderr}")
-            
+            print(f"   Error: {result.output}")
+
     except Exception as e:
         print(f"Error in CLI demonstration: {e}")
 
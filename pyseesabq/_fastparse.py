@@ -0,0 +1,151 @@
+"""
+Optional Numba-accelerated tokenizer for Abaqus data blocks.
+
+This module compiles a small ASCII number scanner with Numba's nopython mode
+so the hot tokenization loop runs over raw uint8 buffers instead of CPython
+strings. It is imported lazily by the parser; if Numba is not installed the
+import fails and the parser keeps its pure-NumPy path.
+"""
+
+from typing import Optional
+
+import numpy as np
+from numba import int64, njit
+from numba.types import Array, uint8, float64
+
+
+# Powers of ten up to 10**22, the largest exactly representable in a float64.
+# Converted from exact Python ints so the table itself carries no rounding.
+_POW10 = np.array([float(10 ** k) for k in range(23)], dtype=np.float64)
+
+# Decimal mantissas up to 2**53 convert to float64 exactly; beyond that (or
+# beyond the exact power-of-ten table) the scanner bails out to strtod.
+_MAX_EXACT_MANTISSA = 1 << 53
+
+# Stop accumulating mantissa digits past this point: further digits cannot
+# be exact anyway (see above) and would eventually overflow the int64.
+_MANTISSA_ACC_LIMIT = 10 ** 17
+
+
+# The explicit signature makes compilation eager: it happens once at import
+# (numba.pycc-style AOT is gone from current Numba) and cache=True persists
+# the machine code on disk, so fresh interpreters skip JIT warmup entirely
+# after the first run on a given machine.
+@njit(int64(Array(uint8, 1, 'C', readonly=True), Array(float64, 1, 'C')),
+      cache=True, nogil=True)
+def _scan_numbers(buf: np.ndarray, out: np.ndarray) -> int:  # pragma: no cover - compiled
+    """
+    Scan ASCII numbers from a uint8 buffer into a preallocated float64 array.
+
+    Accepts comma/whitespace separated integers and floats (with optional
+    exponent, including Fortran-style 'D' exponents). Returns the number of
+    values parsed, or -1 if an unexpected character is encountered — or if a
+    value falls outside the exactly-roundable fast path below — so the
+    caller can fall back to the slow path.
+
+    Rounding: the mantissa accumulates as an integer and the final value is
+    one multiply (or divide) by an exact power of ten, i.e. a single IEEE
+    rounding — results are bit-identical to float()/strtod. Values needing
+    more than that (mantissas over 2**53, |decimal exponent| > 22) are rare
+    in FE input decks and take the fallback instead of being approximated.
+    """
+    n = 0
+    i = 0
+    size = buf.size
+    while i < size:
+        c = buf[i]
+        # Separators and whitespace: ',', ' ', '\t', '\n', '\r'
+        if c == 44 or c == 32 or c == 9 or c == 10 or c == 13:
+            i += 1
+            continue
+
+        negative = False
+        if c == 43 or c == 45:  # '+' / '-'
+            negative = c == 45
+            i += 1
+            if i >= size:
+                return -1
+
+        mantissa = 0
+        exponent = 0
+        n_digits = 0
+        while i < size and 48 <= buf[i] <= 57:
+            if mantissa < _MANTISSA_ACC_LIMIT:
+                mantissa = mantissa * 10 + (buf[i] - 48)
+            else:
+                exponent += 1
+            n_digits += 1
+            i += 1
+        if i < size and buf[i] == 46:  # '.'
+            i += 1
+            while i < size and 48 <= buf[i] <= 57:
+                if mantissa < _MANTISSA_ACC_LIMIT:
+                    mantissa = mantissa * 10 + (buf[i] - 48)
+                    exponent -= 1
+                n_digits += 1
+                i += 1
+        if n_digits == 0:
+            return -1
+
+        # 'e' / 'E' / 'd' / 'D'
+        if i < size and (buf[i] == 101 or buf[i] == 69 or buf[i] == 100 or buf[i] == 68):
+            i += 1
+            exp_sign = 1
+            if i < size and (buf[i] == 43 or buf[i] == 45):
+                if buf[i] == 45:
+                    exp_sign = -1
+                i += 1
+            exp_value = 0
+            exp_digits = 0
+            while i < size and 48 <= buf[i] <= 57:
+                exp_value = exp_value * 10 + (buf[i] - 48)
+                exp_digits += 1
+                i += 1
+            if exp_digits == 0:
+                return -1
+            exponent += exp_sign * exp_value
+
+        # Outside the window where one float operation rounds correctly:
+        # hand the whole block to the fallback parser
+        if mantissa > _MAX_EXACT_MANTISSA or exponent > 22 or exponent < -22:
+            return -1
+        if exponent >= 0:
+            value = mantissa * _POW10[exponent]
+        else:
+            value = mantissa / _POW10[-exponent]
+
+        if n >= out.size:
+            return -1
+        out[n] = -value if negative else value
+        n += 1
+
+    return n
+
+
+def parse_numbers(data: bytes, expected: int = 0) -> Optional[np.ndarray]:
+    """
+    Parse all comma/whitespace separated numbers in ``data``.
+
+    Args:
+        data: Raw ASCII bytes of one data block.
+        expected: Expected value count, when the caller knows it (e.g. rows
+            times columns of a block). Sizes the output buffer exactly
+            instead of at the worst-case bound.
+
+    Returns:
+        A flat float64 array of the parsed values, or None if the buffer
+        contains tokens the fast scanner does not understand.
+    """
+    buf = np.frombuffer(data, dtype=np.uint8)
+    # Upper bound on the token count: one value per separator plus one
+    bound = buf.size // 2 + 2
+    size = expected if 0 < expected < bound else bound
+    out = np.empty(size, dtype=np.float64)
+    count = _scan_numbers(buf, out)
+    if count < 0 and size < bound:
+        # The estimate was too tight (ragged block); rescan at the bound
+        out = np.empty(bound, dtype=np.float64)
+        count = _scan_numbers(buf, out)
+    if count < 0:
+        return None
+    return out[:count]
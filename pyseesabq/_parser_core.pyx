@@ -0,0 +1,154 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+Optional Cython-compiled tokenizer for Abaqus data blocks.
+
+This is the ahead-of-time counterpart of _fastparse: the same ASCII number
+scanner, compiled to C at build time so there is no JIT warmup cost on small
+files. Built only when Cython is available (see setup.py); the parser falls
+back to the Numba or pure-NumPy path when the extension is absent.
+"""
+
+import numpy as np
+
+cimport numpy as cnp
+
+
+# Powers of ten up to 10**22, the largest exactly representable in a double.
+# Filled from exact Python ints at import so the table carries no rounding.
+cdef double _POW10[23]
+for _k in range(23):
+    _POW10[_k] = float(10 ** _k)
+
+# Decimal mantissas up to 2**53 convert to double exactly; beyond that (or
+# beyond the exact power-of-ten table) the scanner bails out to strtod.
+DEF MAX_EXACT_MANTISSA = 9007199254740992  # 2**53
+
+# Stop accumulating mantissa digits past this point: further digits cannot
+# be exact anyway (see above) and would eventually overflow the long long.
+DEF MANTISSA_ACC_LIMIT = 100000000000000000  # 10**17
+
+
+cdef Py_ssize_t _scan(const unsigned char* buf, Py_ssize_t size,
+                      double* out, Py_ssize_t out_size) nogil:
+    """
+    C scanner core; returns the value count, or -1 on a bad token or a
+    value outside the exactly-roundable fast path.
+
+    Rounding: the mantissa accumulates as an integer and the final value is
+    one multiply (or divide) by an exact power of ten, i.e. a single IEEE
+    rounding — results are bit-identical to float()/strtod. Values needing
+    more than that (mantissas over 2**53, |decimal exponent| > 22) are rare
+    in FE input decks and take the fallback instead of being approximated.
+    """
+    cdef Py_ssize_t n = 0
+    cdef Py_ssize_t i = 0
+    cdef unsigned char c
+    cdef bint negative
+    cdef long long mantissa
+    cdef double value
+    cdef int exponent, n_digits, exp_sign, exp_value, exp_digits
+
+    while i < size:
+        c = buf[i]
+        # Separators and whitespace: ',', ' ', '\t', '\n', '\r'
+        if c == 44 or c == 32 or c == 9 or c == 10 or c == 13:
+            i += 1
+            continue
+
+        negative = False
+        if c == 43 or c == 45:  # '+' / '-'
+            negative = c == 45
+            i += 1
+            if i >= size:
+                return -1
+
+        mantissa = 0
+        exponent = 0
+        n_digits = 0
+        while i < size and 48 <= buf[i] <= 57:
+            if mantissa < MANTISSA_ACC_LIMIT:
+                mantissa = mantissa * 10 + (buf[i] - 48)
+            else:
+                exponent += 1
+            n_digits += 1
+            i += 1
+        if i < size and buf[i] == 46:  # '.'
+            i += 1
+            while i < size and 48 <= buf[i] <= 57:
+                if mantissa < MANTISSA_ACC_LIMIT:
+                    mantissa = mantissa * 10 + (buf[i] - 48)
+                    exponent -= 1
+                n_digits += 1
+                i += 1
+        if n_digits == 0:
+            return -1
+
+        # 'e' / 'E' / 'd' / 'D'
+        if i < size and (buf[i] == 101 or buf[i] == 69 or buf[i] == 100 or buf[i] == 68):
+            i += 1
+            exp_sign = 1
+            if i < size and (buf[i] == 43 or buf[i] == 45):
+                if buf[i] == 45:
+                    exp_sign = -1
+                i += 1
+            exp_value = 0
+            exp_digits = 0
+            while i < size and 48 <= buf[i] <= 57:
+                exp_value = exp_value * 10 + (buf[i] - 48)
+                exp_digits += 1
+                i += 1
+            if exp_digits == 0:
+                return -1
+            exponent += exp_sign * exp_value
+
+        # Outside the window where one float operation rounds correctly:
+        # hand the whole block to the fallback parser
+        if mantissa > MAX_EXACT_MANTISSA or exponent > 22 or exponent < -22:
+            return -1
+        if exponent >= 0:
+            value = mantissa * _POW10[exponent]
+        else:
+            value = mantissa / _POW10[-exponent]
+
+        if n >= out_size:
+            return -1
+        out[n] = -value if negative else value
+        n += 1
+
+    return n
+
+
+def parse_numbers(data, Py_ssize_t expected=0):
+    """
+    Parse all comma/whitespace separated numbers in ``data``.
+
+    Args:
+        data: Raw ASCII bytes of one data block.
+        expected: Expected value count, when the caller knows it. Sizes the
+            output buffer exactly instead of at the worst-case bound.
+
+    Returns:
+        A flat float64 array of the parsed values, or None if the buffer
+        contains tokens the scanner does not understand.
+    """
+    cdef const unsigned char[:] buf = data
+    cdef Py_ssize_t size = buf.shape[0]
+    # Upper bound on the token count: one value per separator plus one
+    cdef Py_ssize_t bound = size // 2 + 2
+    cdef Py_ssize_t out_size = expected if 0 < expected < bound else bound
+    cdef cnp.ndarray[cnp.float64_t, ndim=1] out = np.empty(out_size, dtype=np.float64)
+    cdef Py_ssize_t count
+
+    if size == 0:
+        return out[:0]
+
+    with nogil:
+        count = _scan(&buf[0], size, <double*> out.data, out_size)
+    if count < 0 and out_size < bound:
+        # The estimate was too tight (ragged block); rescan at the bound
+        out = np.empty(bound, dtype=np.float64)
+        with nogil:
+            count = _scan(&buf[0], size, <double*> out.data, bound)
+    if count < 0:
+        return None
+    return out[:count]
@@ -4,31 +4,75 @@ Converter module for transforming Abaqus data to OpenSeesPy Python script.
 This module provides the core conversion functionality from Abaqus finite element
 models to OpenSeesPy format, handling nodes, elements, materials, sections,
 boundary conditions, and loads.
+
+The script scaffolding lives in a Jinja2 template (templates/opensees.py.j2)
+compiled once at import; the converter only assembles the render context. Bulk
+entity tables (nodes, elements, boundaries, loads) are still formatted through
+vectorized NumPy calls — at those row counts np.savetxt beats a template loop —
+and are dropped into the template as finished blocks.
 """
 
+import io
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Any, Dict, Iterator, List, Optional
 from datetime import datetime
 
+import jinja2
+import numpy as np
+
 from .parser import AbaqusParser
 from .mapping import ELEMENT_TYPE_MAPPING, get_opensees_element_type
 
 
 logger = logging.getLogger(__name__)
 
+# One compiled template shared by every converter instance
+_JINJA_ENV = jinja2.Environment(
+    loader=jinja2.PackageLoader('pyseesabq', 'templates'),
+    trim_blocks=True,
+    lstrip_blocks=True,
+    auto_reload=False,
+)
+_TEMPLATE = _JINJA_ENV.get_template('opensees.py.j2')
+
+# OpenSeesPy element types that take a material tag instead of a section tag
+_SOLID_ELEMENT_TYPES = frozenset({'stdBrick', 'FourNodeTetrahedron'})
+
+
+def _format_block(array: np.ndarray, fmt: str) -> str:
+    """
+    Format a 2D array as one text block with a single np.savetxt call.
+
+    This pushes the per-row formatting loop down into NumPy's C code instead
+    of evaluating one Python f-string per row.
+
+    Args:
+        array: 2D array whose rows fill the format template.
+        fmt: printf-style row template, e.g. "node(%d, %s, %s, %s)".
+
+    Returns:
+        The formatted block without the trailing newline.
+    """
+    buf = io.StringIO()
+    np.savetxt(buf, array, fmt=fmt)
+    return buf.getvalue().rstrip('\n')
+
 
 class AbaqusToOpenSeesConverter:
     """
     Converter class for transforming Abaqus finite element models to OpenSeesPy.
-    
+
     This class handles the conversion of all major components including nodes,
     elements, materials, sections, boundary conditions, and loads.
+
+    The output script is rendered from the shared Jinja2 template; convert()
+    returns it as one string, iter_script() streams the rendered chunks.
     """
-    
+
     def __init__(self, parser_data: Optional[AbaqusParser] = None):
         """
         Initialize converter with parsed Abaqus data.
-        
+
         Args:
             parser_data: Parsed Abaqus data. If None, must be provided during convert().
         """
@@ -37,17 +81,76 @@ class AbaqusToOpenSeesConverter:
         self.material_tags: Dict[str, int] = {}  # Maps Abaqus material names to OpenSees tags
         self.section_tags: Dict[str, int] = {}   # Maps Abaqus section names to OpenSees tags
         self.element_tags: Dict[str, int] = {}   # Maps Abaqus element IDs to OpenSees tags
-        
+
     def convert(self, inp_file_path: Optional[str] = None) -> str:
         """
         Convert Abaqus .inp file to OpenSeesPy script.
-        
+
         Args:
             inp_file_path: Path to Abaqus .inp file if parser_data not provided.
-            
+
         Returns:
             Complete OpenSeesPy Python script as string.
-            
+
+        Raises:
+            ValueError: If no Abaqus data is provided.
+            FileNotFoundError: If inp_file_path doesn't exist.
+        """
+        script = _TEMPLATE.render(self._render_context(inp_file_path))
+        self.opensees_script = script.split("\n")
+        return script
+
+    def iter_script(self, inp_file_path: Optional[str] = None) -> Iterator[str]:
+        """
+        Lazily render the OpenSeesPy script as a stream of text chunks.
+
+        This is the streaming counterpart of convert(): chunks come straight
+        from the template's render loop, so writing them to a file never
+        holds the whole script text.
+
+        Args:
+            inp_file_path: Path to Abaqus .inp file if parser_data not provided.
+
+        Yields:
+            Rendered text chunks, in order, ready for writelines().
+
+        Raises:
+            ValueError: If no Abaqus data is provided.
+            FileNotFoundError: If inp_file_path doesn't exist.
+        """
+        return _TEMPLATE.generate(self._render_context(inp_file_path))
+
+    def convert_stream(self, fp, inp_file_path: Optional[str] = None) -> None:
+        """
+        Render the OpenSeesPy script directly into a file object.
+
+        Unlike convert(), the full script text is never materialized: the
+        template stream dumps rendered chunks into ``fp`` as they are
+        produced.
+
+        Args:
+            fp: Writable text file object receiving the script.
+            inp_file_path: Path to Abaqus .inp file if parser_data not provided.
+
+        Raises:
+            ValueError: If no Abaqus data is provided.
+            FileNotFoundError: If inp_file_path doesn't exist.
+        """
+        _TEMPLATE.stream(self._render_context(inp_file_path)).dump(fp)
+
+    def _render_context(self, inp_file_path: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Build the template render context from the parsed data.
+
+        Populates the material/section tag maps as a side effect, then
+        formats the bulk entity blocks with the vectorized helpers.
+
+        Args:
+            inp_file_path: Path to Abaqus .inp file if parser_data not provided.
+
+        Returns:
+            The context dict consumed by templates/opensees.py.j2.
+
         Raises:
             ValueError: If no Abaqus data is provided.
             FileNotFoundError: If inp_file_path doesn't exist.
@@ -55,329 +158,262 @@ class AbaqusToOpenSeesConverter:
         if inp_file_path and not self.parser_data:
             parser = AbaqusParser()
             self.parser_data = parser.parse(inp_file_path)
-        
+
         if not self.parser_data:
             raise ValueError("No Abaqus data provided for conversion.")
-        
+
         logger.info("Starting Abaqus to OpenSeesPy conversion")
-        
-        # Initialize script
-        self._add_script_header()
-        
-        # Process model components in logical order
-        self._process_nodes()
-        self._process_materials()
-        self._process_sections()
-        self._process_elements()
-        self._process_boundaries()
-        self._process_loads()
-        
-        # Add analysis commands
-        self._add_analysis_setup()
-        
-        # Add footer
-        self._add_script_footer()
-        
+
+        bc_node_ids, bc_rows = self.parser_data.boundary_table()
+        load_node_ids, load_rows = self.parser_data.load_table()
+
+        context = {
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'n_nodes': self.parser_data.node_ids.size,
+            'n_elements': self._count_elements(),
+            'n_materials': len(self.parser_data.materials),
+            'n_sections': len(self.parser_data.sections),
+            'node_block': self._node_block(),
+            'materials': self._material_entries(),
+            'sections': self._section_entries(),
+            'element_groups': self._element_groups(),
+            'boundary_block': self._boundary_block(bc_node_ids, bc_rows),
+            'n_constrained': bc_node_ids.size,
+            'load_block': self._load_block(load_node_ids, load_rows),
+            'n_loaded': load_node_ids.size,
+        }
+
         logger.info("Conversion completed successfully")
-        return "\n".join(self.opensees_script)
-    
-    def _add_script_header(self) -> None:
-        """Add script header with metadata and model initialization."""
-        current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        
-        header = [
-            "#!/usr/bin/env python3",
-            '"""',
-            "OpenSeesPy Model - Converted from Abaqus .inp file",
-            f"Generated by PySeesAbq (RAPID-CLIO) on {current_time}",
-            "Maintained by: Omer Jauhar",
-            "",
-            "This script contains the converted finite element model.",
-            "Make sure OpenSeesPy is installed: pip install openseespy",
-            '"""',
-            "",
-            "import sys",
-            "try:",
-            "    from openseespy.opensees import *",
-            "except ImportError:",
-            '    print("Error: OpenSeesPy not found. Install with: pip install openseespy")',
-            "    sys.exit(1)",
-            "",
-            "# Model Statistics",
-            f"# Nodes: {len(self.parser_data.nodes)}",
-            f"# Elements: {len(self.parser_data.elements)}",
-            f"# Materials: {len(self.parser_data.materials)}",
-            f"# Sections: {len(self.parser_data.sections)}",
-            "",
-            "# Initialize OpenSees Model",
-            "wipe()",
-            "model('basic', '-ndm', 3, '-ndf', 6)",
-            ""
-        ]
-        
-        self.opensees_script.extend(header)
-    
-    def _process_nodes(self) -> None:
-        """Process nodes from Abaqus data."""
-        if not self.parser_data.nodes:
+        return context
+
+    def _count_elements(self) -> int:
+        """Count elements from the per-type arrays without building dict views."""
+        return sum(
+            len(ids) for ids, _ in self.parser_data.elements_by_type.values()
+        )
+
+    def _node_block(self) -> Optional[str]:
+        """Format the node table as one block, or None when there are no nodes."""
+        node_ids = self.parser_data.node_ids
+        node_coords = self.parser_data.node_coords
+        if node_ids.size == 0:
             logger.warning("No nodes found in Abaqus data")
-            return
-            
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("# NODES")
-        self.opensees_script.append("# ============================================")
-        
-        for node_id, coords in self.parser_data.nodes.items():
-            x, y, z = coords
-            self.opensees_script.append(f"node({node_id}, {x:.6f}, {y:.6f}, {z:.6f})")
-            
-        self.opensees_script.append(f"# Total nodes: {len(self.parser_data.nodes)}")
-        self.opensees_script.append("")
-    
-    def _process_materials(self) -> None:
-        """Process materials from Abaqus data."""
+            return None
+
+        # Emit the whole node table in one vectorized formatting call.
+        # float32 storage (AbaqusParser(high_precision=False)) carries ~7
+        # significant digits, which %.9g preserves without bloating the file
+        coord_fmt = "%.9g" if node_coords.dtype == np.float32 else "%s"
+        return _format_block(
+            np.column_stack([node_ids.astype(np.float64), node_coords]),
+            f"node(%d, {coord_fmt}, {coord_fmt}, {coord_fmt})"
+        )
+
+    def _material_entries(self) -> List[Dict[str, Any]]:
+        """Assign material tags and collect the template entries."""
         if not self.parser_data.materials:
             logger.warning("No materials found in Abaqus data")
-            return
-            
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("# MATERIALS")
-        self.opensees_script.append("# ============================================")
-        
+            return []
+
+        entries = []
         material_tag = 1
         for material_name, properties in self.parser_data.materials.items():
-            E = properties.get('E', 2.1e11)  # Default steel elastic modulus (Pa)
-            nu = properties.get('nu', 0.3)   # Default Poisson's ratio
-            rho = properties.get('rho', 7850.0)  # Default steel density (kg/m³)
-            
-            self.opensees_script.append(f"# Material: {material_name}")
-            self.opensees_script.append(
-                f"nDMaterial('ElasticIsotropic', {material_tag}, {E:.3e}, {nu:.3f}, {rho:.1f})"
-            )
+            entries.append({
+                'name': material_name,
+                'tag': material_tag,
+                'E': properties.get('E', 2.1e11),   # Default steel elastic modulus (Pa)
+                'nu': properties.get('nu', 0.3),    # Default Poisson's ratio
+                'rho': properties.get('rho', 7850.0),  # Default steel density (kg/m³)
+            })
             self.material_tags[material_name] = material_tag
             material_tag += 1
-        
-        self.opensees_script.append(f"# Total materials: {len(self.parser_data.materials)}")
-        self.opensees_script.append("")
-    
-    def _process_sections(self):
-        """Process sections from Abaqus data."""
-        self.opensees_script.append("# Sections")
-        
+        return entries
+
+    def _section_entries(self) -> List[Dict[str, Any]]:
+        """Assign section tags and collect the template entries."""
+        entries = []
         section_tag = 1
         for section_name, properties in self.parser_data.sections.items():
             material_name = properties.get('material')
             thickness = properties.get('thickness', 1.0)  # Default thickness
-            
+
             if material_name in self.material_tags:
-                material_tag = self.material_tags[material_name]
                 material_props = self.parser_data.materials.get(material_name, {})
-                E = material_props.get('E', 1.0)  # Default elastic modulus
-                nu = material_props.get('nu', 0.3)  # Default Poisson's ratio
-                
-                self.opensees_script.append(
-                    f"section('ElasticMembranePlateSection', {section_tag}, {E}, {nu}, {thickness}, {material_tag})"
-                )
+                entries.append({
+                    'tag': section_tag,
+                    'E': material_props.get('E', 1.0),    # Default elastic modulus
+                    'nu': material_props.get('nu', 0.3),  # Default Poisson's ratio
+                    'thickness': thickness,
+                    'material_tag': self.material_tags[material_name],
+                })
                 self.section_tags[section_name] = section_tag
                 section_tag += 1
-        
-        self.opensees_script.append("")
-    
-    def _process_elements(self) -> None:
-        """Process elements from Abaqus data with improved mapping."""
-        if not self.parser_data.elements:
+        return entries
+
+    def _element_groups(self) -> List[Dict[str, Any]]:
+        """Format each element type as one block and collect the entries."""
+        # Consume the parser's per-type arrays directly; no regrouping pass
+        elements_by_type = self.parser_data.elements_by_type
+        if not elements_by_type:
             logger.warning("No elements found in Abaqus data")
-            return
-            
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("# ELEMENTS")
-        self.opensees_script.append("# ============================================")
-        
-        # Group elements by type for batch processing
-        elements_by_type: Dict[str, List[tuple]] = {}
-        for element_id, element_data in self.parser_data.elements.items():
-            element_type = element_data['type']
-            if element_type not in elements_by_type:
-                elements_by_type[element_type] = []
-            elements_by_type[element_type].append((element_id, element_data['nodes']))
-        
-        # Process each element type
-        for element_type, elements in elements_by_type.items():
-            self.opensees_script.append(f"# {element_type} Elements ({len(elements)} elements)")
-            
+            return []
+
+        # Cache the default tags once instead of materializing the values
+        # view inside the per-type loop
+        default_section_tag = next(iter(self.section_tags.values()), 1)
+        default_material_tag = next(iter(self.material_tags.values()), 1)
+
+        groups = []
+        for element_type, (element_ids, connectivity) in elements_by_type.items():
             # Determine the OpenSeesPy element type
             opensees_element_type = get_opensees_element_type(element_type)
-            
-            # Find appropriate section/material tag for these elements
-            section_tag = self._get_section_tag_for_element_type(element_type)
-            
-            # Create elements in OpenSeesPy
-            for element_id, node_ids in elements:
-                nodes_str = ", ".join(map(str, node_ids))
-                
-                if opensees_element_type in ['ShellMITC4', 'ShellDKGT']:
-                    self.opensees_script.append(
-                        f"element('{opensees_element_type}', {element_id}, {nodes_str}, {section_tag})"
-                    )
-                elif opensees_element_type in ['stdBrick', 'FourNodeTetrahedron']:
-                    # For solid elements, use material tag directly
-                    material_tag = list(self.material_tags.values())[0] if self.material_tags else 1
-                    self.opensees_script.append(
-                        f"element('{opensees_element_type}', {element_id}, {nodes_str}, {material_tag})"
-                    )
-                else:
-                    # Default element creation
-                    self.opensees_script.append(
-                        f"element('{opensees_element_type}', {element_id}, {nodes_str}, {section_tag})"
-                    )
-            
-            self.opensees_script.append("")
-        
-        self.opensees_script.append(f"# Total elements: {len(self.parser_data.elements)}")
-        self.opensees_script.append("")
-    
+
+            if opensees_element_type in _SOLID_ELEMENT_TYPES:
+                # For solid elements, use material tag directly
+                tag = default_material_tag
+            else:
+                tag = default_section_tag
+
+            groups.append({
+                'abaqus_type': element_type,
+                'count': len(element_ids),
+                'block': self._format_element_group(
+                    opensees_element_type, element_ids, connectivity, tag
+                ),
+            })
+        return groups
+
+    def _format_element_group(self, opensees_element_type: str,
+                              element_ids: np.ndarray, connectivity: Any,
+                              tag: int) -> str:
+        """
+        Format one element group as a single text block.
+
+        Groups with uniform connectivity (the normal case — each Abaqus type
+        has a fixed node count) arrive as 2D arrays and are emitted through
+        one vectorized np.savetxt call; ragged groups arrive as row lists and
+        fall back to a per-row template loop.
+
+        Args:
+            opensees_element_type: OpenSeesPy element type for the group.
+            element_ids: Array of element ids for the group.
+            connectivity: (N, k) connectivity array, or list of node-id rows
+                when arities are mixed within the type.
+            tag: Section or material tag shared by the group.
+
+        Returns:
+            The formatted element block.
+        """
+        if isinstance(connectivity, np.ndarray):
+            table = np.column_stack([np.asarray(element_ids, dtype=np.int64),
+                                     connectivity])
+            fmt = (f"element('{opensees_element_type}', %d, "
+                   + ", ".join(["%d"] * connectivity.shape[1]) + f", {tag})")
+            return _format_block(table, fmt)
+
+        # Ragged connectivity: build one %-template per arity so the constant
+        # fields are interpolated once, not on every row
+        templates: Dict[int, str] = {}
+        lines = []
+        for element_id, node_ids in zip(element_ids, connectivity):
+            template = templates.get(len(node_ids))
+            if template is None:
+                template = (f"element('{opensees_element_type}', %d, "
+                            + ", ".join(["%d"] * len(node_ids)) + f", {tag})")
+                templates[len(node_ids)] = template
+            lines.append(template % (element_id, *node_ids))
+        return "\n".join(lines)
+
     def _get_section_tag_for_element_type(self, element_type: str) -> int:
         """
         Get appropriate section tag for a given element type.
-        
+
         Args:
             element_type: Abaqus element type
-            
+
         Returns:
             Section tag to use for this element type
         """
         # For simplicity, use the first available section tag
-        if self.section_tags:
-            return list(self.section_tags.values())[0]
-        return 1
-    
+        return next(iter(self.section_tags.values()), 1)
+
     def _map_element_type(self, abaqus_element_type: str) -> str:
         """
         Map Abaqus element types to OpenSeesPy element types.
-        
+
         Args:
             abaqus_element_type: Abaqus element type.
-            
+
         Returns:
             Equivalent OpenSeesPy element type.
         """
         return get_opensees_element_type(abaqus_element_type)
-    
-    def _process_boundaries(self) -> None:
-        """Process boundary conditions from Abaqus data."""
-        if not self.parser_data.boundaries:
+
+    def _boundary_block(self, node_ids: np.ndarray,
+                        constraint_rows: np.ndarray) -> Optional[str]:
+        """Format the fix() table as one block, or None when unconstrained."""
+        if node_ids.size == 0:
             logger.warning("No boundary conditions found in Abaqus data")
-            return
-            
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("# BOUNDARY CONDITIONS")
-        self.opensees_script.append("# ============================================")
-        
-        for node_id, constraints in self.parser_data.boundaries.items():
-            constraints_str = ", ".join(map(str, constraints))
-            self.opensees_script.append(f"fix({node_id}, {constraints_str})")
-        
-        self.opensees_script.append(f"# Total constrained nodes: {len(self.parser_data.boundaries)}")
-        self.opensees_script.append("")
-    
-    def _process_loads(self) -> None:
-        """Process loads from Abaqus data."""
-        if not self.parser_data.loads:
+            return None
+
+        return _format_block(
+            np.column_stack([node_ids, constraint_rows.astype(np.int64)]),
+            "fix(%d, %d, %d, %d, %d, %d, %d)"
+        )
+
+    def _load_block(self, node_ids: np.ndarray,
+                    load_rows: np.ndarray) -> Optional[str]:
+        """Format the load() table as one block, or None when unloaded."""
+        if node_ids.size == 0:
             logger.info("No loads found in Abaqus data")
-            return
-            
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("# LOADS")
-        self.opensees_script.append("# ============================================")
-        self.opensees_script.append("pattern('Plain', 1, 1)")
-        
-        for node_id, loads in self.parser_data.loads.items():
-            load_str = ", ".join(f"{load:.6f}" for load in loads)
-            self.opensees_script.append(f"load({node_id}, {load_str})")
-        
-        self.opensees_script.append(f"# Total loaded nodes: {len(self.parser_data.loads)}")
-        self.opensees_script.append("")
-    
-    def _add_analysis_setup(self) -> None:
-        """Add analysis setup commands."""
-        self.opensees_script.extend([
-            "# ============================================",
-            "# ANALYSIS SETUP",
-            "# ============================================",
-            "",
-            "# Analysis parameters",
-            "constraints('Plain')",
-            "numberer('Plain')",
-            "system('BandGeneral')",
-            "test('NormDispIncr', 1.0e-6, 10)",
-            "algorithm('Newton')",
-            "integrator('LoadControl', 1.0)",
-            "analysis('Static')",
-            "",
-            "# Run analysis",
-            "print('Starting analysis...')",
-            "ok = analyze(1)",
-            "if ok != 0:",
-            "    print('Analysis failed!')",
-            "else:",
-            "    print('Analysis completed successfully!')",
-            ""
-        ])
-
-    def _add_script_footer(self) -> None:
-        """Add script footer with post-processing commands."""
-        self.opensees_script.extend([
-            "# ============================================",
-            "# POST-PROCESSING",
-            "# ============================================",
-            "",
-            "# Print model information",
-            "print('\\nModel Summary:')",
-            f"print('Nodes: {len(self.parser_data.nodes) if self.parser_data else 0}')",
-            f"print('Elements: {len(self.parser_data.elements) if self.parser_data else 0}')",
-            f"print('Materials: {len(self.parser_data.materials) if self.parser_data else 0}')",
-            "",
-            "# Uncomment the following lines for detailed output:",
-            "# printModel()",
-            "# printA()",
-            "",
-            "print('\\nOpenSeesPy model ready for further analysis!')",
-            "print('Generated by PySeesAbq (RAPID-CLIO) - Maintained by Omer Jauhar')"
-        ])
+            return None
+
+        return _format_block(
+            np.column_stack([node_ids.astype(np.float64), load_rows]),
+            "load(%d, %.6f, %.6f, %.6f, %.6f, %.6f, %.6f)"
+        )
 
 # Legacy function for backward compatibility
 def convert(inp_file_path: str, output_file_path: Optional[str] = None, return_string: bool = False) -> Optional[str]:
     """
     Convert Abaqus .inp file to OpenSeesPy Python script.
-    
+
     This is a convenience function that creates a parser and converter internally.
     For more control, use AbaqusParser and AbaqusToOpenSeesConverter directly.
-    
+
     Args:
         inp_file_path: Path to Abaqus .inp file.
         output_file_path: Path to save the OpenSeesPy script. If None, doesn't save to file.
         return_string: Whether to return the script as a string. Default is False.
-                                       
+
     Returns:
         OpenSeesPy script if return_string is True, else None.
-        
+
     Raises:
         FileNotFoundError: If inp_file_path doesn't exist.
     """
     logger.info(f"Converting {inp_file_path} using legacy convert function")
-    
+
     parser = AbaqusParser()
     parser_data = parser.parse(inp_file_path)
-    
+
     converter = AbaqusToOpenSeesConverter(parser_data)
+
+    if output_file_path and not return_string:
+        # Stream the rendered chunks straight to disk; no full-text buffer
+        with open(output_file_path, 'w', encoding='utf-8') as f:
+            f.writelines(converter.iter_script())
+        logger.info(f"Saved converted script to {output_file_path}")
+        return None
+
     opensees_script = converter.convert()
-    
+
     if output_file_path:
         with open(output_file_path, 'w', encoding='utf-8') as f:
             f.write(opensees_script)
         logger.info(f"Saved converted script to {output_file_path}")
-    
+
     if return_string:
         return opensees_script
-    
-    return None
\ No newline at end of file
+
+    return None
@@ -12,6 +12,27 @@ from .parser import AbaqusParser
 from .converter import AbaqusToOpenSeesConverter
 
 
+def _write_script(converter: AbaqusToOpenSeesConverter, output_path: Path) -> None:
+    """
+    Stream the rendered script to ``output_path`` via a sibling temp file.
+
+    The atomic os.replace means a crash mid-write never leaves a truncated
+    script behind; the fadvise hint keeps batch runs over thousands of files
+    from flooding the page cache with output we will not read back.
+    """
+    tmp_path = output_path.with_suffix(output_path.suffix + '.tmp')
+    try:
+        with open(tmp_path, 'w', encoding='utf-8', buffering=1 << 20) as f:
+            converter.convert_stream(f)
+            f.flush()
+            if hasattr(os, 'posix_fadvise'):
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+        os.replace(tmp_path, output_path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
 def convert_file(
     input_file: Union[str, Path],
     output_file: Optional[Union[str, Path]] = None,
@@ -59,24 +80,22 @@ def convert_file(
     if verbose:
         print(f"Converting {input_path} to {output_path}")
     
-    # Parse and convert
-    parser = AbaqusParser()
-    parsed_data = parser.parse(str(input_path))
-    
+    # Parse, then stream the rendered script straight into the output file:
+    # the full script text is never held in memory. A fresh parser per call
+    # keeps these entry points thread-safe and lets the arrays be collected
+    # when the call returns; repeat conversions are served by the disk cache.
+    parsed_data = AbaqusParser().parse(str(input_path))
+
     converter = AbaqusToOpenSeesConverter(parsed_data)
-    opensees_script = converter.convert()
-    
-    # Write output file
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(opensees_script)
-    
+    _write_script(converter, output_path)
+
     if verbose:
         print(f"Conversion completed successfully!")
         print(f"Generated: {output_path}")
-        print(f"Nodes: {len(parsed_data.nodes)}")
-        print(f"Elements: {len(parsed_data.elements)}")
+        print(f"Nodes: {parsed_data.node_ids.size}")
+        print(f"Elements: {sum(len(ids) for ids, _ in parsed_data.elements_by_type.values())}")
         print(f"Materials: {len(parsed_data.materials)}")
-    
+
     return str(output_path)
 
 
@@ -99,17 +118,14 @@ def convert(
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
     
-    # Parse and convert
-    parser = AbaqusParser()
-    parsed_data = parser.parse(str(input_path))
-    
+    # Parse and convert (fresh parser per call; see convert_file)
+    parsed_data = AbaqusParser().parse(str(input_path))
+
     converter = AbaqusToOpenSeesConverter(parsed_data)
-    opensees_script = converter.convert()
-    
+
     if return_string:
-        return opensees_script
+        return converter.convert()
     else:
         output_path = input_path.with_suffix('.py')
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(opensees_script)
+        _write_script(converter, output_path)
         return str(output_path)
@@ -1,20 +1,21 @@
-"""
-Mapping module for Abaqus to OpenSeesPy conversions.
-"""
-
 """
 Mapping module for Abaqus to OpenSeesPy conversions.
 
 This module provides comprehensive mapping tables and functions for converting
 Abaqus element types, material properties, and section definitions to their
 OpenSeesPy equivalents.
+
+The public mapping tables are read-only MappingProxyType views so consumers
+cannot mutate them at runtime.
 """
 
-from typing import Dict, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Mapping, Optional
 
 
 # Element type mapping from Abaqus to OpenSeesPy
-ELEMENT_TYPE_MAPPING: Dict[str, str] = {
+ELEMENT_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
     # Shell elements
     'S4': 'ShellMITC4',
     'S4R': 'ShellMITC4',
@@ -57,70 +58,78 @@ ELEMENT_TYPE_MAPPING: Dict[str, str] = {
     'M3D4R': 'quad4n',
     'M3D6': 'tri31',
     'M3D8': 'quad4n',
-}
+})
 
 # Material type mapping
-MATERIAL_TYPE_MAPPING: Dict[str, str] = {
+MATERIAL_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
     'ELASTIC': 'ElasticIsotropic',
     'PLASTIC': 'J2Plasticity',
     'HYPERELASTIC': 'ElasticIsotropic',  # Simplified mapping
     'CONCRETE': 'Concrete01',
     'STEEL': 'Steel01',
-}
+})
 
 # Section type mapping
-SECTION_TYPE_MAPPING: Dict[str, str] = {
+SECTION_TYPE_MAPPING: Mapping[str, str] = MappingProxyType({
     'SHELL': 'ElasticMembranePlateSection',
     'SOLID': 'ElasticIsotropic',
     'BEAM': 'ElasticBeamColumn',
     'PIPE': 'ElasticBeamColumn',
     'GENERAL': 'ElasticBeamColumn',
-}
+})
 
 # DOF mapping for boundary conditions
-DOF_MAPPING: Dict[int, int] = {
-    1: 1,  # UX -> UX  
+DOF_MAPPING: Mapping[int, int] = MappingProxyType({
+    1: 1,  # UX -> UX
     2: 2,  # UY -> UY
     3: 3,  # UZ -> UZ
     4: 4,  # ROTX -> ROTX
-    5: 5,  # ROTY -> ROTY  
+    5: 5,  # ROTY -> ROTY
     6: 6,  # ROTZ -> ROTZ
-}
-
-
+})
+
+# Element-family fallbacks for types absent from the direct mapping, checked
+# in order. Precomputed here so lookups do one dict probe plus, rarely, this
+# short prefix scan instead of a chain of startswith branches.
+_ELEMENT_PREFIX_FALLBACK = (
+    ('S', 'ShellMITC4'),          # Default shell element
+    ('C3D', 'stdBrick'),          # Default solid element
+    ('B', 'elasticBeamColumn'),   # Default beam element
+    ('PIPE', 'elasticBeamColumn'),
+    ('T', 'truss'),               # Default truss element
+    ('M', 'quad4n'),              # Default membrane element
+)
+
+
+@lru_cache(maxsize=256)
 def get_opensees_element_type(abaqus_type: str) -> str:
     """
     Get the equivalent OpenSeesPy element type for an Abaqus element.
-    
+
     Args:
         abaqus_type: Abaqus element type (e.g., 'S4R', 'C3D8')
-        
+
     Returns:
         Corresponding OpenSeesPy element type
     """
     # Normalize the input (remove spaces, convert to uppercase)
     normalized_type = abaqus_type.strip().upper()
-    
+
     # Direct mapping lookup
-    if normalized_type in ELEMENT_TYPE_MAPPING:
-        return ELEMENT_TYPE_MAPPING[normalized_type]
-    
+    mapped = ELEMENT_TYPE_MAPPING.get(normalized_type)
+    if mapped is not None:
+        return mapped
+
     # Fallback mappings based on element family
-    if normalized_type.startswith('S'):
-        return 'ShellMITC4'  # Default shell element
-    elif normalized_type.startswith('C3D'):
-        return 'stdBrick'    # Default solid element  
-    elif normalized_type.startswith(('B', 'PIPE')):
-        return 'elasticBeamColumn'  # Default beam element
-    elif normalized_type.startswith('T'):
-        return 'truss'       # Default truss element
-    elif normalized_type.startswith('M'):
-        return 'quad4n'      # Default membrane element
-    else:
-        # Ultimate fallback
-        return 'ShellMITC4'
+    for prefix, fallback in _ELEMENT_PREFIX_FALLBACK:
+        if normalized_type.startswith(prefix):
+            return fallback
 
+    # Ultimate fallback
+    return 'ShellMITC4'
 
+
+@lru_cache(maxsize=256)
 def get_opensees_material_type(abaqus_material_type: str) -> str:
     """
     Get the equivalent OpenSeesPy material type for an Abaqus material.
@@ -135,6 +144,7 @@ def get_opensees_material_type(abaqus_material_type: str) -> str:
     return MATERIAL_TYPE_MAPPING.get(normalized_type, 'ElasticIsotropic')
 
 
+@lru_cache(maxsize=256)
 def get_opensees_section_type(abaqus_section_type: str) -> str:
     """
     Get the equivalent OpenSeesPy section type for an Abaqus section.
@@ -149,81 +159,68 @@ def get_opensees_section_type(abaqus_section_type: str) -> str:
     return SECTION_TYPE_MAPPING.get(normalized_type, 'ElasticMembranePlateSection')
 
 
+# All 64 possible constraint patterns, indexed by DOF bitmask (bit i set
+# means DOF i+1 fixed). Precomputed so map_dof_constraints reduces to bit-ORs
+# and one table index instead of six conditional stores per call.
+_DOF_TABLE = tuple(
+    tuple((mask >> i) & 1 for i in range(6)) for mask in range(64)
+)
+
+
 def map_dof_constraints(abaqus_dofs: list) -> list:
     """
     Map Abaqus DOF constraints to OpenSeesPy format.
-    
+
     Args:
         abaqus_dofs: List of Abaqus DOF numbers to constrain
-        
+
     Returns:
         List of OpenSeesPy constraint values (0=free, 1=fixed)
     """
-    # Initialize all 6 DOFs as free (0)
-    constraints = [0, 0, 0, 0, 0, 0]
-    
-    # Set constrained DOFs to 1
+    mask = 0
     for dof in abaqus_dofs:
         if 1 <= dof <= 6:
-            constraints[dof - 1] = 1  # Convert 1-based to 0-based indexing
-            
-    return constraints
+            mask |= 1 << (dof - 1)  # Convert 1-based DOF to bit position
+    return list(_DOF_TABLE[mask])
+
+
+# Expected node counts per element type; built once at import instead of on
+# every get_element_node_count call.
+_NODE_COUNTS: Dict[str, int] = {
+    # Shell elements
+    'S3': 3, 'S3R': 3, 'STRI3': 3,
+    'S4': 4, 'S4R': 4, 'S4R5': 4,
+    'S6': 6, 'S8R': 8, 'STRI65': 6,
+
+    # Solid elements
+    'C3D4': 4, 'C3D10': 10,
+    'C3D6': 6, 'C3D15': 15,
+    'C3D8': 8, 'C3D8R': 8, 'C3D8I': 8, 'C3D8H': 8,
+    'C3D20': 20, 'C3D20R': 20,
+
+    # Beam/truss elements
+    'B31': 2, 'B31R': 2, 'B32': 3, 'B33': 2,
+    'T3D2': 2, 'T3D3': 3, 'T2D2': 2, 'T2D3': 3,
+
+    # Membrane elements
+    'M3D3': 3, 'M3D4': 4, 'M3D4R': 4,
+    'M3D6': 6, 'M3D8': 8,
+}
 
 
 def get_element_node_count(element_type: str) -> int:
     """
     Get the expected number of nodes for an element type.
-    
-    Args:
-        element_type: Abaqus element type
-        
-    Returns:
-        Expected number of nodes for the element
-    """
-    node_counts = {
-        # Shell elements
-        'S3': 3, 'S3R': 3, 'STRI3': 3,
-        'S4': 4, 'S4R': 4, 'S4R5': 4,
-        'S6': 6, 'S8R': 8, 'STRI65': 6,
-        
-        # Solid elements
-        'C3D4': 4, 'C3D10': 10,
-        'C3D6': 6, 'C3D15': 15,
-        'C3D8': 8, 'C3D8R': 8, 'C3D8I': 8, 'C3D8H': 8,
-        'C3D20': 20, 'C3D20R': 20,
-        
-        # Beam/truss elements
-        'B31': 2, 'B31R': 2, 'B32': 3, 'B33': 2,
-        'T3D2': 2, 'T3D3': 3, 'T2D2': 2, 'T2D3': 3,
-        
-        # Membrane elements
-        'M3D3': 3, 'M3D4': 4, 'M3D4R': 4,
-        'M3D6': 6, 'M3D8': 8,
-    }
-    
-    return node_counts.get(element_type.upper(), 4)  # Default to 4 nodes
-    return ELEMENT_TYPE_MAPPING.get(abaqus_type.upper(), 'ShellMITC4')
 
-def get_opensees_material_type(abaqus_type):
-    """
-    Get the equivalent OpenSeesPy material type.
-    
     Args:
-        abaqus_type (str): Abaqus material type
-        
-    Returns:
-        str: OpenSeesPy material type or default
-    """
-    return MATERIAL_TYPE_MAPPING.get(abaqus_type.upper(), 'ElasticIsotropic')
+        element_type: Abaqus element type
 
-def get_opensees_section_type(abaqus_type):
-    """
-    Get the equivalent OpenSeesPy section type.
-    
-    Args:
-        abaqus_type (str): Abaqus section type
-        
     Returns:
-        str: OpenSeesPy section type or default
+        Expected number of nodes for the element
     """
-    return SECTION_TYPE_MAPPING.get(abaqus_type.upper(), 'ElasticMembranePlateSection')
\ No newline at end of file
+    # Probe with the raw key first; already-uppercase inputs (the common
+    # case) skip the .upper() copy
+    count = _NODE_COUNTS.get(element_type)
+    if count is not None:
+        return count
+    return _NODE_COUNTS.get(element_type.upper(), 4)  # Default to 4 nodes
\ No newline at end of file
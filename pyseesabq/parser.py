@@ -5,433 +5,883 @@ This module provides comprehensive parsing of Abaqus input files, extracting
 nodes, elements, materials, sections, boundary conditions, loads, and sets.
 """
 
+import hashlib
 import logging
+import mmap
+import os
+import pickle
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Union, Any
+from typing import Callable, Dict, List, Optional, Tuple, Union, Any
 
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _get_scanner():
+    """
+    Resolve the compiled number scanner on first use (memoized).
+
+    Importing here instead of at module scope keeps numba's several-hundred-
+    millisecond import off the package's cold-start path: --version, --help
+    and consumers that never parse a block never pay for it. Prefers the
+    Cython build (AOT, no JIT warmup) over the Numba module; returns None
+    when neither accelerator is available and callers take the NumPy path.
+    """
+    try:
+        # Compiled Cython tokenizer, built only when Cython was available
+        from . import _parser_core
+        return _parser_core
+    except ImportError:
+        pass
+    try:
+        from . import _fastparse
+        return _fastparse
+    except ImportError:
+        # Numba is an optional accelerator; fall back to the pure-NumPy path
+        return None
+
+# Matches the keyword-line options the parser consumes; compiled once at
+# module load so every header is scanned in a single C-level pass.
+_KW_RE = re.compile(r'(name|type|elset|nset|material)\s*=\s*([^,\s]+)', re.IGNORECASE)
+
+# On-disk parse cache: pickled parser state keyed by (path, mtime, size),
+# so repeat conversions of an unchanged file skip tokenization entirely.
+# Bounded: each store prunes the oldest entries beyond this count.
+_CACHE_MAX_ENTRIES = 64
+
+
+def _cache_dir() -> Path:
+    """Cache directory, honoring XDG_CACHE_HOME at call time (not import)."""
+    return Path(
+        os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')
+    ) / 'pyseesabq'
+
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Best-effort eviction: drop the oldest entries beyond the bound."""
+    try:
+        entries = sorted(cache_dir.glob('*.pkl'), key=lambda p: p.stat().st_mtime)
+    except OSError:
+        return
+    for stale in entries[:-_CACHE_MAX_ENTRIES]:
+        try:
+            stale.unlink()
+        except OSError:
+            pass
+
+
+def _cache_path(file_path: Path, options: Tuple[Any, ...] = ()) -> Optional[Path]:
+    """
+    Return the cache file for ``file_path``, or None if it cannot be keyed.
+
+    Args:
+        file_path: The input file being parsed.
+        options: Parser options that affect the parsed state (e.g. the
+            precision flag); they are folded into the key so entries written
+            under different options never alias each other.
+    """
+    try:
+        stat = file_path.stat()
+        key = f"{file_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{options!r}"
+    except OSError:
+        return None
+    digest = hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+    return _cache_dir() / f"{digest}.pkl"
+
+
+def _header_kwargs(line: str) -> Dict[str, str]:
+    """
+    Extract the key=value options of a keyword line in a single regex pass.
+
+    Args:
+        line: The stripped '*' keyword line.
+
+    Returns:
+        Mapping of lowercased option names to their (case-preserved) values.
+    """
+    return {
+        match.group(1).lower(): match.group(2)
+        for match in _KW_RE.finditer(line)
+    }
+
+
+def _has_generate(line: str) -> bool:
+    """
+    True when a set header carries GENERATE as a standalone option field.
+
+    Matching the comma-separated fields (not a substring of the whole line)
+    keeps set names like 'regenerate_zone' from triggering range mode.
+    """
+    return any(
+        field.strip().lower() == 'generate'
+        for field in line.split(',')[1:]
+    )
+
+
+# Whitespace stripped from data lines before field splitting.
+_WS = b' \t\r'
+
+
+def _split_fields(line: bytes) -> List[bytes]:
+    """
+    Split a bytes data line into comma-separated fields in one pass.
+
+    translate() drops all whitespace in a single C-level scan, so the
+    per-field .strip() of the old tokenizer disappears; int() and float()
+    accept the resulting bytes tokens directly.
+    """
+    return line.translate(None, _WS).split(b',')
+
+
+def _decode_header(line: bytes) -> str:
+    """
+    Decode a keyword line for header option extraction.
+
+    Only keyword lines are ever decoded — data lines stay bytes all the way
+    into the numeric scanners — so the cost is one small decode per block.
+    """
+    try:
+        return line.decode('utf-8')
+    except UnicodeDecodeError:
+        return line.decode('latin-1')
+
+
 class AbaqusParser:
     """
     Parser for Abaqus .inp files.
-    
+
     This class extracts nodes, elements, materials, sections, boundary conditions,
     loads, element sets, and node sets from Abaqus input files with comprehensive
     error handling and validation.
+
+    The file is consumed in a single streaming pass: each ``*KEYWORD`` line
+    installs a data-line handler, and subsequent data lines are fed to that
+    handler as they arrive, so peak memory stays independent of file size.
     """
-    
-    def __init__(self):
-        """Initialize the parser with empty data structures."""
-        self.nodes: Dict[int, List[float]] = {}          # {node_id: [x, y, z]}
-        self.elements: Dict[int, Dict[str, Any]] = {}    # {element_id: {"type": type, "nodes": [node_ids]}}
+
+    def __init__(self, high_precision: bool = True, use_cache: bool = True):
+        """
+        Initialize the parser with empty data structures.
+
+        Args:
+            high_precision: Keep coordinates and loads as float64 (the
+                default, preserving exact text round-trips). Pass False to
+                store them as float32, halving memory bandwidth for large
+                models at ~7 significant digits of precision.
+            use_cache: Reuse (and populate) the on-disk parse cache keyed
+                by the input file's path, mtime and size. Loading pickled
+                state is far cheaper than re-tokenizing an unchanged file.
+        """
+        self.high_precision = high_precision
+        self.use_cache = use_cache
+        self._float_dtype = np.float64 if high_precision else np.float32
+
+        # Nodes and elements are stored struct-of-arrays: contiguous NumPy
+        # arrays instead of one Python dict/list per entity. The dict-shaped
+        # `nodes`/`elements` views are materialized lazily for compatibility.
+        self.node_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self.node_coords: np.ndarray = np.empty((0, 3), dtype=self._float_dtype)
+        # {element_type: (ids array, (N, k) connectivity array or list of rows)}
+        self.elements_by_type: Dict[str, Tuple[np.ndarray, Any]] = {}
+
         self.materials: Dict[str, Dict[str, float]] = {} # {material_name: {property: value}}
         self.sections: Dict[str, Dict[str, Any]] = {}    # {section_name: {property: value}}
-        self.boundaries: Dict[int, List[int]] = {}       # {node_id: [dof_constraints]}
-        self.loads: Dict[int, List[float]] = {}          # {node_id: [Fx, Fy, Fz, Mx, My, Mz]}
+
+        # Boundary and load tables: one compact NumPy row per touched node,
+        # addressed through a node-id -> row map. The dict-shaped
+        # `boundaries`/`loads` views are materialized lazily.
+        self._bc_node_to_row: Dict[int, int] = {}
+        self._bc_rows: np.ndarray = np.zeros((0, 6), dtype=np.int8)
+        self._load_node_to_row: Dict[int, int] = {}
+        self._load_rows: np.ndarray = np.zeros((0, 6), dtype=self._float_dtype)
+        self._boundaries_cache: Optional[Dict[int, List[int]]] = None
+        self._loads_cache: Optional[Dict[int, List[float]]] = None
+
         self.element_sets: Dict[str, List[int]] = {}     # {set_name: [element_ids]}
         self.node_sets: Dict[str, List[int]] = {}        # {set_name: [node_ids]}
         self.material_mapping: Dict[str, str] = {}       # {section_name: material_name}
-        
+
         # State tracking during parsing
         self.current_section: Optional[str] = None
         self.current_material: Optional[str] = None
         self.current_elset: Optional[str] = None
         self.current_nset: Optional[str] = None
-        
+
+        # Streaming state: the handler installed by the current *KEYWORD,
+        # invoked once per raw bytes data line until the next keyword line
+        # arrives.
+        self._handler: Optional[Callable[[bytes, int], None]] = None
+        self._current_element_type: Optional[str] = None
+        self._current_property: Optional[str] = None
+        self._pending_section: Optional[str] = None
+        self._set_generate: bool = False
+
+        # Node/element data lines are collected per block and parsed in one
+        # vectorized NumPy call when the block ends (next keyword or EOF).
+        self._block: List[Tuple[int, bytes]] = []
+        self._flush: Optional[Callable[[], None]] = None
+
+        # Completed blocks queue up as ('nodes'|'elements', element_type,
+        # data lines) tuples and are parsed at the end of the pass — in
+        # parallel when the GIL-free fast scanner is available. The resulting
+        # array chunks are then concatenated once; the dict views are cached
+        # on first access.
+        self._pending_blocks: List[Tuple[str, Optional[str], List[Tuple[int, bytes]]]] = []
+        self._node_chunks: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._elem_chunks: Dict[str, List[Tuple[Any, Any]]] = {}
+        self._nodes_cache: Optional[Dict[int, List[float]]] = None
+        self._elements_cache: Optional[Dict[int, Dict[str, Any]]] = None
+        self._node_order: Optional[np.ndarray] = None
+
+        # Keyword dispatch: maps the lowercased bytes keyword (first comma-
+        # separated field of a '*' line) to the method that enters that
+        # parsing mode. Matching on bytes means headers of keywords the
+        # parser ignores are never decoded at all.
+        self._dispatch: Dict[bytes, Callable[[str], None]] = {
+            b'*node': self._enter_nodes,
+            b'*element': self._enter_elements,
+            b'*material': self._enter_material,
+            b'*elastic': self._enter_elastic,
+            b'*density': self._enter_density,
+            b'*shell section': self._enter_section,
+            b'*solid section': self._enter_section,
+            b'*boundary': self._enter_boundary,
+            b'*cload': self._enter_load,
+            b'*elset': self._enter_elset,
+            b'*nset': self._enter_nset,
+        }
+
     def parse(self, inp_file_path: Union[str, Path]) -> 'AbaqusParser':
         """
         Parse the Abaqus .inp file.
-        
+
         Args:
             inp_file_path: Path to the Abaqus .inp file.
-            
+
         Returns:
             The parser instance with parsed data.
-            
+
         Raises:
             FileNotFoundError: If the input file doesn't exist.
             ValueError: If the file cannot be parsed.
         """
         file_path = Path(inp_file_path)
-        
+
         if not file_path.exists():
             raise FileNotFoundError(f"Input file not found: {file_path}")
-            
+
+        cache_file = (
+            _cache_path(file_path, (self.high_precision,))
+            if self.use_cache else None
+        )
+        cached = self._load_cached(cache_file)
+        if cached is not None:
+            logger.info(f"Loaded cached parse of {file_path}")
+            # Adopt the cached state: parse() must leave *this* instance
+            # populated, since callers read results off the parser they hold
+            self.__dict__.update(cached.__dict__)
+            return self
+
+        # Start from a clean slate so one parser instance can be reused
+        # across files (e.g. the module-level parser in core)
+        self._reset()
+
         logger.info(f"Parsing Abaqus file: {file_path}")
-        
+
+        # Memory-map the file and scan raw bytes: no per-line str decode,
+        # and the numeric scanners read the buffer pages directly
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files (and exotic filesystems) cannot be mapped
+                self._parse_stream(iter(f.readline, b''))
+            else:
+                with mm:
+                    self._parse_stream(iter(mm.readline, b''))
+
+        self._finalize_arrays()
+
+        n_elements = sum(len(ids) for ids, _ in self.elements_by_type.values())
+        logger.info(f"Parsing completed: {self.node_ids.size} nodes, {n_elements} elements")
+
+        self._store_cached(cache_file)
+        return self
+
+    @staticmethod
+    def _load_cached(cache_file: Optional[Path]) -> Optional['AbaqusParser']:
+        """Load a cached parse, or None when absent or unreadable."""
+        if cache_file is None or not cache_file.exists():
+            return None
+        try:
+            with open(cache_file, 'rb') as f:
+                cached = pickle.load(f)
+        except Exception:
+            # A corrupt or incompatible cache entry just means a re-parse
+            return None
+        return cached if isinstance(cached, AbaqusParser) else None
+
+    def _store_cached(self, cache_file: Optional[Path]) -> None:
+        """Best-effort write of the parsed state to the on-disk cache."""
+        if cache_file is None:
+            return
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
-            
-        line_index = 0
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('**'):
-                line_index += 1
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+            _prune_cache(cache_file.parent)
+        except Exception:
+            logger.debug(f"Could not write parse cache entry {cache_file}")
+
+    def _finalize_arrays(self) -> None:
+        """Parse the queued blocks and concatenate them into the SoA arrays."""
+        pending = self._pending_blocks
+        self._pending_blocks = []
+
+        if len(pending) > 1 and _get_scanner() is not None:
+            # Independent blocks parse in parallel: the JIT scanner runs
+            # without the GIL, so threads scale with cores
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                chunks = list(executor.map(self._parse_block, pending))
+        else:
+            chunks = [self._parse_block(block) for block in pending]
+
+        for (kind, element_type, _), chunk in zip(pending, chunks):
+            if chunk is None:
                 continue
-            
-            # Handle section keywords
-            if line.startswith('*'):
-                line_index = self._parse_keyword(lines, line_index)
+            if kind == 'nodes':
+                self._node_chunks.append(chunk)
             else:
-                line_index += 1
-                
-        logger.info(f"Parsing completed: {len(self.nodes)} nodes, {len(self.elements)} elements")
-        return self
-    
-    def _parse_keyword(self, lines: List[str], start_index: int) -> int:
+                self._elem_chunks.setdefault(element_type, []).append(chunk)
+
+        if self._node_chunks:
+            self.node_ids = np.concatenate([ids for ids, _ in self._node_chunks])
+            self.node_coords = np.vstack(
+                [coords for _, coords in self._node_chunks]
+            ).astype(self._float_dtype, copy=False)
+        self._node_chunks = []
+
+        for element_type, chunks in self._elem_chunks.items():
+            ids = np.concatenate(
+                [np.asarray(chunk_ids, dtype=np.int64) for chunk_ids, _ in chunks]
+            )
+            conns = [conn for _, conn in chunks]
+            widths = {conn.shape[1] for conn in conns if isinstance(conn, np.ndarray)}
+            if len(widths) == 1 and all(isinstance(conn, np.ndarray) for conn in conns):
+                conn: Any = np.vstack(conns)
+            else:
+                # Mixed arities within one type: keep connectivity as row lists
+                conn = []
+                for chunk_conn in conns:
+                    conn.extend(
+                        chunk_conn.tolist() if isinstance(chunk_conn, np.ndarray)
+                        else chunk_conn
+                    )
+            self.elements_by_type[element_type] = (ids, conn)
+        self._elem_chunks = {}
+
+        self._nodes_cache = None
+        self._elements_cache = None
+
+    @property
+    def nodes(self) -> Dict[int, List[float]]:
+        """Dict view {node_id: [x, y, z]}, built lazily from the SoA arrays."""
+        if self._nodes_cache is None:
+            self._nodes_cache = dict(
+                zip(self.node_ids.tolist(), self.node_coords.tolist())
+            )
+        return self._nodes_cache
+
+    def node_row(self, node_id: int) -> int:
+        """
+        Return the row of ``node_id`` in node_ids/node_coords.
+
+        Binary search over the id array (through a lazily built sort order,
+        since ids need not arrive sorted) — so single lookups never force
+        the dict view into existence.
+
+        Raises:
+            KeyError: If the node id is not present.
         """
-        Parse a keyword section from the Abaqus file.
-        
+        if self._node_order is None:
+            self._node_order = np.argsort(self.node_ids)
+        pos = np.searchsorted(self.node_ids, node_id, sorter=self._node_order)
+        if pos < self.node_ids.size:
+            row = int(self._node_order[pos])
+            if self.node_ids[row] == node_id:
+                return row
+        raise KeyError(node_id)
+
+    @property
+    def boundaries(self) -> Dict[int, List[int]]:
+        """Dict view {node_id: [dof_constraints]}, built lazily."""
+        if self._boundaries_cache is None:
+            self._boundaries_cache = {
+                node_id: self._bc_rows[row].tolist()
+                for node_id, row in self._bc_node_to_row.items()
+            }
+        return self._boundaries_cache
+
+    @property
+    def loads(self) -> Dict[int, List[float]]:
+        """Dict view {node_id: [Fx, Fy, Fz, Mx, My, Mz]}, built lazily."""
+        if self._loads_cache is None:
+            self._loads_cache = {
+                node_id: self._load_rows[row].tolist()
+                for node_id, row in self._load_node_to_row.items()
+            }
+        return self._loads_cache
+
+    def boundary_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (node_ids, (N, 6) int8 constraint rows) for constrained nodes."""
+        count = len(self._bc_node_to_row)
+        node_ids = np.fromiter(self._bc_node_to_row.keys(), dtype=np.int64, count=count)
+        return node_ids, self._bc_rows[:count]
+
+    def load_table(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (node_ids, (N, 6) float64 load rows) for loaded nodes."""
+        count = len(self._load_node_to_row)
+        node_ids = np.fromiter(self._load_node_to_row.keys(), dtype=np.int64, count=count)
+        return node_ids, self._load_rows[:count]
+
+    def _bc_row(self, node_id: int) -> int:
+        """Map a node id to its boundary row, growing the table as needed."""
+        row = self._bc_node_to_row.get(node_id)
+        if row is None:
+            row = len(self._bc_node_to_row)
+            if row >= self._bc_rows.shape[0]:
+                # Grow in chunks to amortize reallocation
+                grown = np.zeros((self._bc_rows.shape[0] + 1024, 6), dtype=np.int8)
+                grown[:row] = self._bc_rows[:row]
+                self._bc_rows = grown
+            self._bc_node_to_row[node_id] = row
+        return row
+
+    def _load_row(self, node_id: int) -> int:
+        """Map a node id to its load row, growing the table as needed."""
+        row = self._load_node_to_row.get(node_id)
+        if row is None:
+            row = len(self._load_node_to_row)
+            if row >= self._load_rows.shape[0]:
+                grown = np.zeros((self._load_rows.shape[0] + 1024, 6),
+                                 dtype=self._float_dtype)
+                grown[:row] = self._load_rows[:row]
+                self._load_rows = grown
+            self._load_node_to_row[node_id] = row
+        return row
+
+    @property
+    def elements(self) -> Dict[int, Dict[str, Any]]:
+        """Dict view {element_id: {"type": ..., "nodes": [...]}}, built lazily."""
+        if self._elements_cache is None:
+            elements: Dict[int, Dict[str, Any]] = {}
+            for element_type, (ids, conn) in self.elements_by_type.items():
+                rows = conn.tolist() if isinstance(conn, np.ndarray) else conn
+                for element_id, node_ids in zip(ids.tolist(), rows):
+                    elements[element_id] = {'type': element_type, 'nodes': node_ids}
+            self._elements_cache = elements
+        return self._elements_cache
+
+    def _reset(self) -> None:
+        """Clear all parsed data and streaming state for a fresh pass."""
+        self.__init__(self.high_precision, self.use_cache)
+
+    def _parse_stream(self, line_iter) -> None:
+        """
+        Drive the streaming state machine over an iterable of bytes lines.
+
         Args:
-            lines: All lines in the file.
-            start_index: Starting index for the keyword section.
-            
-        Returns:
-            Next line index to process.
+            line_iter: Iterable yielding the raw bytes lines of the input file.
         """
-        line = lines[start_index].strip()
-        keyword = line.split(',')[0].strip().lower()
-        
-        # Parse different keyword sections
-        if keyword == '*node':
-            return self._parse_nodes(lines, start_index)
-        elif keyword.startswith('*element'):
-            return self._parse_elements(lines, start_index)
-        elif keyword == '*material':
-            return self._parse_material(lines, start_index)
-        elif keyword in ['*elastic', '*density']:
-            return self._parse_material_property(lines, start_index, keyword[1:])
-        elif keyword == '*shell section' or keyword == '*solid section':
-            return self._parse_section(lines, start_index)
-        elif keyword == '*boundary':
-            return self._parse_boundary(lines, start_index)
-        elif keyword == '*cload':
-            return self._parse_load(lines, start_index)
-        elif keyword == '*elset':
-            return self._parse_elset(lines, start_index)
-        elif keyword == '*nset':
-            return self._parse_nset(lines, start_index)
-        
-        # Skip unknown keywords
-        return start_index + 1
-
-    def _parse_nodes(self, lines: List[str], start_index: int) -> int:
-        """Parse node definitions."""
-        line_index = start_index + 1
-        
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Stop if we hit another keyword or empty line
-            if not line or line.startswith('*'):
-                break
-                
-            # Skip comments
-            if line.startswith('**'):
-                line_index += 1
+        for line_number, raw_line in enumerate(line_iter, 1):
+            line = raw_line.strip()
+            if not line:
                 continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 4:
-                    node_id = int(parts[0])
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    self.nodes[node_id] = [x, y, z]
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse node at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-
-    def _parse_elements(self, lines: List[str], start_index: int) -> int:
-        """Parse element definitions."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        # Extract element type
-        element_type = None
-        for part in parts:
-            if part.strip().lower().startswith('type='):
-                element_type = part.strip().split('=')[1].strip()
-                break
-        
+
+            # One slice comparison covers both keyword and comment lines;
+            # only '*' lines pay for the second (comment) check
+            if line[:1] == b'*':
+                if line[1:2] != b'*':
+                    self._enter_keyword(line)
+            elif self._handler is not None:
+                self._handler(line, line_number)
+
+        self._flush_block()
+
+    def _enter_keyword(self, line: bytes) -> None:
+        """
+        Switch parsing mode based on a keyword line.
+
+        Args:
+            line: The raw, stripped '*' keyword line.
+        """
+        self._flush_block()
+
+        # Match on lowercased bytes: keywords the parser does not handle are
+        # rejected by the dict probe without ever being decoded
+        keyword = line.split(b',', 1)[0].strip().lower()
+
+        # Unknown keywords uninstall the handler so their data lines are skipped
+        self._handler = None
+
+        enter = self._dispatch.get(keyword)
+        if enter is not None:
+            # Only headers of handled keywords pay for a decode
+            enter(_decode_header(line))
+
+    def _flush_block(self) -> None:
+        """Queue the collected node/element block for deferred parsing."""
+        if self._flush is not None:
+            flush, self._flush = self._flush, None
+            flush()
+        self._block = []
+
+    def _queue_nodes(self) -> None:
+        """Queue the current block as a node block."""
+        if self._block:
+            self._pending_blocks.append(('nodes', None, self._block))
+
+    def _queue_elements(self) -> None:
+        """Queue the current block as an element block of the current type."""
+        if self._block:
+            self._pending_blocks.append(
+                ('elements', self._current_element_type, self._block)
+            )
+
+    # --- Mode entry: one call per keyword line -------------------------------
+
+    def _enter_nodes(self, line: str) -> None:
+        """Enter node parsing mode."""
+        self._block = []
+        self._handler = self._collect_line
+        self._flush = self._queue_nodes
+
+    def _enter_elements(self, line: str) -> None:
+        """Enter element parsing mode, extracting the element type."""
+        element_type = _header_kwargs(line).get('type')
+
         if not element_type:
             logger.warning(f"No element type found in line: {line}")
-            return start_index + 1
-        
-        line_index = start_index + 1
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Stop if we hit another keyword or empty line
-            if not line or line.startswith('*'):
-                break
-                
-            # Skip comments
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 2:
-                    element_id = int(parts[0])
-                    node_ids = [int(parts[i]) for i in range(1, len(parts))]
-                    self.elements[element_id] = {
-                        'type': element_type,
-                        'nodes': node_ids
-                    }
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse element at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-
-    def _parse_material(self, lines: List[str], start_index: int) -> int:
-        """Parse material definition."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        material_name = None
-        for part in parts:
-            if part.strip().lower().startswith('name='):
-                material_name = part.split('=')[1].strip()
-                break
-        
+            return
+
+        # One shared str per type; per-type dict lookups hit the pointer-
+        # equality fast path
+        self._current_element_type = sys.intern(element_type)
+        self._block = []
+        self._handler = self._collect_line
+        self._flush = self._queue_elements
+
+    def _enter_material(self, line: str) -> None:
+        """Parse a material definition header."""
+        material_name = _header_kwargs(line).get('name')
+
         if material_name:
             self.current_material = material_name
             if material_name not in self.materials:
                 self.materials[material_name] = {}
-        
-        return start_index + 1
 
-    def _parse_material_property(self, lines: List[str], start_index: int, property_type: str) -> int:
-        """Parse material property like elastic or density."""
+    def _enter_elastic(self, line: str) -> None:
+        """Enter elastic material property mode."""
+        self._enter_material_property('elastic')
+
+    def _enter_density(self, line: str) -> None:
+        """Enter density material property mode."""
+        self._enter_material_property('density')
+
+    def _enter_material_property(self, property_type: str) -> None:
+        """Enter material property mode for the current material."""
         if not self.current_material:
-            return start_index + 1
-            
-        line_index = start_index + 1
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            if not line or line.startswith('*'):
-                break
-                
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                if property_type == 'elastic' and len(parts) >= 2:
-                    self.materials[self.current_material]['E'] = float(parts[0])
-                    self.materials[self.current_material]['nu'] = float(parts[1])
-                elif property_type == 'density' and len(parts) >= 1:
-                    self.materials[self.current_material]['rho'] = float(parts[0])
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse {property_type} at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-
-    def _parse_section(self, lines: List[str], start_index: int) -> int:
-        """Parse section definition."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        section_name = f"section_{len(self.sections) + 1}"
-        material_name = None
-        elset_name = None
-        
-        for part in parts:
-            part = part.strip().lower()
-            if part.startswith('material='):
-                material_name = part.split('=')[1].strip()
-            elif part.startswith('elset='):
-                elset_name = part.split('=')[1].strip()
-        
-        line_index = start_index + 1
-        thickness = 1.0
-        
-        if line_index < len(lines):
-            line = lines[line_index].strip()
-            if line and not line.startswith('*') and not line.startswith('**'):
-                try:
-                    thickness = float(line.split(',')[0])
-                    line_index += 1
-                except (ValueError, IndexError):
-                    pass
-        
+            return
+        self._current_property = property_type
+        self._handler = self._handle_material_property_line
+
+    def _enter_section(self, line: str) -> None:
+        """Parse a section definition header."""
+        kwargs = _header_kwargs(line)
+        material_name = kwargs.get('material')
+        elset_name = kwargs.get('elset')
+
+        # Sections are keyed by their ELSET name when the header carries one,
+        # falling back to a positional name for anonymous sections
+        section_name = elset_name or f"section_{len(self.sections) + 1}"
+
         self.sections[section_name] = {
             'material': material_name,
-            'thickness': thickness,
+            'thickness': 1.0,
             'elset': elset_name
         }
-        
+
         if material_name:
             self.material_mapping[section_name] = material_name
-        
-        return line_index
-
-    def _parse_boundary(self, lines: List[str], start_index: int) -> int:
-        """Parse boundary conditions."""
-        line_index = start_index + 1
-        
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            if not line or line.startswith('*'):
-                break
-                
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
+
+        # The first data line (if any) carries the thickness
+        self._pending_section = section_name
+        self._handler = self._handle_section_line
+
+    def _enter_boundary(self, line: str) -> None:
+        """Enter boundary condition parsing mode."""
+        self._handler = self._handle_boundary_line
+
+    def _enter_load(self, line: str) -> None:
+        """Enter concentrated load parsing mode."""
+        self._handler = self._handle_load_line
+
+    def _enter_elset(self, line: str) -> None:
+        """Parse an element set header and enter elset mode."""
+        elset_name = _header_kwargs(line).get('elset')
+
+        if not elset_name:
+            return
+
+        self.current_elset = elset_name
+        self.element_sets.setdefault(elset_name, [])
+        self._set_generate = _has_generate(line)
+        self._handler = self._handle_elset_line
+
+    def _enter_nset(self, line: str) -> None:
+        """Parse a node set header and enter nset mode."""
+        nset_name = _header_kwargs(line).get('nset')
+
+        if not nset_name:
+            return
+
+        self.current_nset = nset_name
+        self.node_sets.setdefault(nset_name, [])
+        self._set_generate = _has_generate(line)
+        self._handler = self._handle_nset_line
+
+    # --- Data-line handlers: one call per data line --------------------------
+
+    def _collect_line(self, line: bytes, line_number: int) -> None:
+        """Buffer a node/element data line for vectorized block parsing."""
+        self._block.append((line_number, line))
+
+    def _parse_block(self, pending: Tuple[str, Optional[str], List[Tuple[int, bytes]]]):
+        """Parse one queued block into its array chunk."""
+        kind, _, block = pending
+        if kind == 'nodes':
+            return self._parse_node_block(block)
+        return self._parse_element_block(block)
+
+    @staticmethod
+    def _block_array(block: List[Tuple[int, bytes]], dtype) -> Optional[np.ndarray]:
+        """
+        Parse a data block into a 2D array in a single NumPy call.
+
+        Returns None if the block is ragged or contains unparsable tokens,
+        in which case the caller falls back to per-line parsing.
+        """
+        if not block:
+            return None
+        buf = b','.join(line.rstrip(b',') for _, line in block)
+
+        arr = None
+        scanner = _get_scanner()
+        if scanner is not None:
+            # Compiled byte scanner (Cython AOT preferred over Numba JIT);
+            # returns None on unexpected tokens. The row count is known, so
+            # size the output from the first row's field count instead of
+            # the worst-case bound
+            fields = block[0][1].rstrip(b',').count(b',') + 1
+            arr = scanner.parse_numbers(buf, expected=fields * len(block))
+        if arr is None:
             try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 3:
-                    node_id = int(parts[0])
-                    dof_start = int(parts[1])
-                    dof_end = int(parts[2])
-                    
-                    # Create constraint array (1=fixed, 0=free)
-                    constraints = [0, 0, 0, 0, 0, 0]
-                    for dof in range(dof_start, dof_end + 1):
-                        if 1 <= dof <= 6:
-                            constraints[dof - 1] = 1
-                    
-                    self.boundaries[node_id] = constraints
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse boundary at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-
-    def _parse_load(self, lines: List[str], start_index: int) -> int:
-        """Parse concentrated loads."""
-        line_index = start_index + 1
-        
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            if not line or line.startswith('*'):
-                break
-                
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
+                arr = np.fromstring(buf, sep=',', dtype=np.float64)
+            except ValueError:
+                # Non-numeric tokens in the block; take the per-line path
+                return None
+
+        if arr.size == 0 or arr.size % len(block) != 0:
+            return None
+        if dtype is not np.float64:
+            arr = arr.astype(dtype)
+        return arr.reshape(len(block), -1)
+
+    @classmethod
+    def _parse_node_block(cls, block: List[Tuple[int, bytes]]):
+        """Parse a *Node block into an (ids, coords) chunk."""
+        arr = cls._block_array(block, np.float64)
+        if arr is not None and arr.shape[1] >= 4:
+            return (arr[:, 0].astype(np.int64), np.ascontiguousarray(arr[:, 1:4]))
+
+        # Ragged or malformed block: fall back to per-line parsing
+        ids: List[int] = []
+        coords: List[List[float]] = []
+        for line_number, line in block:
             try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 3:
+                parts = _split_fields(line)
+                if len(parts) >= 4:
+                    # Parse the whole line before storing anything so a bad
+                    # coordinate cannot leave ids and coords out of step
                     node_id = int(parts[0])
-                    dof = int(parts[1])
-                    magnitude = float(parts[2])
-                    
-                    # Initialize load array [Fx, Fy, Fz, Mx, My, Mz]
-                    if node_id not in self.loads:
-                        self.loads[node_id] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-                    
-                    # Apply load to appropriate DOF
-                    if 1 <= dof <= 6:
-                        self.loads[node_id][dof - 1] = magnitude
+                    xyz = [float(parts[1]), float(parts[2]), float(parts[3])]
+                    ids.append(node_id)
+                    coords.append(xyz)
             except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse load at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-
-    def _parse_elset(self, lines: List[str], start_index: int) -> int:
-        """Parse element set definition."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        elset_name = None
-        for part in parts:
-            if part.strip().lower().startswith('elset='):
-                elset_name = part.split('=')[1].strip()
-                break
-        
-        if not elset_name:
-            return start_index + 1
-        
-        line_index = start_index + 1
-        element_ids = []
-        
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            if not line or line.startswith('*'):
-                break
-                
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                for part in parts:
-                    if part:
-                        element_ids.append(int(part))
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse elset at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-        
-        self.element_sets[elset_name] = element_ids
-        return line_index
-
-    def _parse_nset(self, lines: List[str], start_index: int) -> int:
-        """Parse node set definition."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        nset_name = None
-        for part in parts:
-            if part.strip().lower().startswith('nset='):
-                nset_name = part.split('=')[1].strip()
-                break
-        
-        if not nset_name:
-            return start_index + 1
-        
-        line_index = start_index + 1
-        node_ids = []
-        
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            if not line or line.startswith('*'):
-                break
-                
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
+                logger.warning(
+                    f"Failed to parse node at line {line_number}: "
+                    f"{line.decode('latin-1')} - {e}"
+                )
+        if not ids:
+            return None
+        return (np.asarray(ids, dtype=np.int64), np.asarray(coords, dtype=np.float64))
+
+    @classmethod
+    def _parse_element_block(cls, block: List[Tuple[int, bytes]]):
+        """Parse an *Element block into an (ids, connectivity) chunk."""
+        arr = cls._block_array(block, np.int64)
+        if arr is not None and arr.shape[1] >= 2:
+            return (arr[:, 0], np.ascontiguousarray(arr[:, 1:]))
+
+        # Ragged or malformed block: fall back to per-line parsing
+        ids: List[int] = []
+        rows: List[List[int]] = []
+        for line_number, line in block:
             try:
-                parts = [part.strip() for part in line.split(',')]
-                for part in parts:
-                    if part:
-                        node_ids.append(int(part))
+                parts = _split_fields(line)
+                if len(parts) >= 2:
+                    # Parse the whole line before storing anything so a bad
+                    # node id cannot leave ids and rows out of step
+                    element_id = int(parts[0])
+                    conn = [int(parts[i]) for i in range(1, len(parts))]
+                    ids.append(element_id)
+                    rows.append(conn)
             except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse nset at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-        
-        self.node_sets[nset_name] = node_ids
-        return line_index
+                logger.warning(
+                    f"Failed to parse element at line {line_number}: "
+                    f"{line.decode('latin-1')} - {e}"
+                )
+        if not ids:
+            return None
+        return (ids, rows)
+
+    def _handle_material_property_line(self, line: bytes, line_number: int) -> None:
+        """Parse a material property line (elastic or density)."""
+        try:
+            parts = _split_fields(line)
+            if self._current_property == 'elastic' and len(parts) >= 2:
+                self.materials[self.current_material]['E'] = float(parts[0])
+                self.materials[self.current_material]['nu'] = float(parts[1])
+            elif self._current_property == 'density' and len(parts) >= 1:
+                self.materials[self.current_material]['rho'] = float(parts[0])
+        except (ValueError, IndexError) as e:
+            logger.warning(
+                f"Failed to parse {self._current_property} at line {line_number}: "
+                f"{line.decode('latin-1')} - {e}"
+            )
+
+    def _handle_section_line(self, line: bytes, line_number: int) -> None:
+        """Parse the section thickness from the first data line."""
+        try:
+            thickness = float(line.split(b',')[0])
+            self.sections[self._pending_section]['thickness'] = thickness
+        except (ValueError, IndexError):
+            pass
+        # Only the first data line carries section properties
+        self._handler = None
+
+    def _handle_boundary_line(self, line: bytes, line_number: int) -> None:
+        """Parse a single boundary condition line."""
+        try:
+            parts = _split_fields(line)
+            if len(parts) >= 3:
+                node_id = int(parts[0])
+                dof_start = int(parts[1])
+                dof_end = int(parts[2])
+
+                # Mark the DOF range fixed with a single slice store
+                row = self._bc_row(node_id)
+                self._bc_rows[row, max(dof_start, 1) - 1:min(dof_end, 6)] = 1
+                self._boundaries_cache = None
+        except (ValueError, IndexError) as e:
+            logger.warning(
+                f"Failed to parse boundary at line {line_number}: "
+                f"{line.decode('latin-1')} - {e}"
+            )
+
+    def _handle_load_line(self, line: bytes, line_number: int) -> None:
+        """Parse a single concentrated load line."""
+        try:
+            parts = _split_fields(line)
+            if len(parts) >= 3:
+                node_id = int(parts[0])
+                dof = int(parts[1])
+                magnitude = float(parts[2])
+
+                # Apply load to appropriate DOF
+                if 1 <= dof <= 6:
+                    row = self._load_row(node_id)
+                    self._load_rows[row, dof - 1] = magnitude
+                    self._loads_cache = None
+        except (ValueError, IndexError) as e:
+            logger.warning(
+                f"Failed to parse load at line {line_number}: "
+                f"{line.decode('latin-1')} - {e}"
+            )
+
+    def _set_ids(self, line: bytes) -> List[int]:
+        """
+        Parse one set data line into a list of ids.
+
+        GENERATE headers give ``start, end[, step]`` triplets expanded with
+        np.arange; plain lines parse all ids in one np.fromstring call, so
+        the per-id int() loop never runs in either case.
+        """
+        if self._set_generate:
+            parts = _split_fields(line.rstrip(b','))
+            start, end = int(parts[0]), int(parts[1])
+            step = int(parts[2]) if len(parts) > 2 and parts[2] else 1
+            return np.arange(start, end + 1, step, dtype=np.int64).tolist()
+        return np.fromstring(line.rstrip(b','), sep=',', dtype=np.int64).tolist()
+
+    def _handle_elset_line(self, line: bytes, line_number: int) -> None:
+        """Parse element ids from an elset data line."""
+        try:
+            self.element_sets[self.current_elset].extend(self._set_ids(line))
+        except (ValueError, IndexError) as e:
+            logger.warning(
+                f"Failed to parse elset at line {line_number}: "
+                f"{line.decode('latin-1')} - {e}"
+            )
+
+    def _handle_nset_line(self, line: bytes, line_number: int) -> None:
+        """Parse node ids from an nset data line."""
+        try:
+            self.node_sets[self.current_nset].extend(self._set_ids(line))
+        except (ValueError, IndexError) as e:
+            logger.warning(
+                f"Failed to parse nset at line {line_number}: "
+                f"{line.decode('latin-1')} - {e}"
+            )
+
+
+@lru_cache(maxsize=16)
+def _parse_cached(path: str, mtime_ns: int, size: int) -> AbaqusParser:
+    """Parse ``path``; mtime/size are part of the key, not used directly."""
+    return AbaqusParser().parse(path)
+
+
+def parse_cached(inp_file_path: Union[str, Path]) -> AbaqusParser:
+    """
+    Parse an Abaqus file through an in-process LRU cache.
+
+    Repeat parses of an unchanged file (same path, mtime and size) return
+    the same parser instance immediately — no I/O, not even the on-disk
+    cache's unpickle. The instance is shared between callers; anyone who
+    needs isolated state should call ``AbaqusParser().parse()`` instead.
+
+    Args:
+        inp_file_path: Path to the Abaqus .inp file.
+
+    Returns:
+        The (possibly shared) parsed AbaqusParser instance.
+    """
+    file_path = Path(inp_file_path)
+    stat = file_path.stat()
+    return _parse_cached(str(file_path), stat.st_mtime_ns, stat.st_size)
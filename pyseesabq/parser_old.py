@@ -6,293 +6,492 @@ nodes, elements, materials, sections, boundary conditions, loads, and sets.
 """
 
 import logging
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Union, Any
 
+import numpy as np
+
+try:
+    # Compiled Cython tokenizer, built only when Cython was available
+    from . import _parser_core
+except ImportError:
+    _parser_core = None
+
+try:
+    from . import _fastparse
+except ImportError:
+    # Numba is an optional accelerator; fall back to the pure-NumPy path
+    _fastparse = None
+
 
 logger = logging.getLogger(__name__)
 
+# Pulls every integer out of a data line in one C-level sweep, replacing the
+# per-field split/strip/int chain on element and set lines.
+_INT_RE = re.compile(rb'-?\d+')
+
+# Matches the key=value options of a keyword line; compiled once at module
+# load so each header is scanned in a single C-level pass.
+_KV_RE = re.compile(rb'(\w+)\s*=\s*([^,\s]+)')
+
+
+def _kvs(line: bytes) -> Dict[bytes, bytes]:
+    """Extract the key=value options of a keyword line in one regex pass."""
+    return {m.group(1).lower(): m.group(2) for m in _KV_RE.finditer(line)}
+
+
+def _has_generate(line: bytes) -> bool:
+    """
+    True when a set header carries GENERATE as a standalone option field.
+
+    Matching the comma-separated fields (not a substring of the whole line)
+    keeps set names like 'regenerate_zone' from triggering range mode.
+    """
+    return any(
+        field.strip().lower() == b'generate'
+        for field in line.split(b',')[1:]
+    )
+
+
+def _clean_lines(raw_lines) -> List[bytes]:
+    """Strip an iterable of raw bytes lines, dropping blanks and comments."""
+    return [
+        stripped for stripped in (line.strip() for line in raw_lines)
+        if stripped and not stripped.startswith(b'**')
+    ]
+
+
+def _scan_block(block: List[bytes]) -> Optional[np.ndarray]:
+    """
+    Parse a data block into a 2D float array in a single scanner call.
+
+    Prefers the package's compiled byte scanner (Cython build, then the
+    Numba kernel) and falls back to np.fromstring. Returns None for ragged
+    or unparsable blocks so the caller can take its per-line path.
+    """
+    buf = b','.join(line.rstrip(b',') for line in block)
+
+    arr = None
+    scanner = _parser_core or _fastparse
+    if scanner is not None:
+        fields = block[0].rstrip(b',').count(b',') + 1
+        arr = scanner.parse_numbers(buf, expected=fields * len(block))
+    if arr is None:
+        try:
+            arr = np.fromstring(buf, sep=',')
+        except ValueError:
+            return None
+
+    if arr.size == 0 or arr.size % len(block) != 0:
+        return None
+    return arr.reshape(len(block), -1)
+
 
 class AbaqusParser:
     """
     Parser for Abaqus .inp files.
-    
+
     This class extracts nodes, elements, materials, sections, boundary conditions,
     loads, element sets, and node sets from Abaqus input files with comprehensive
     error handling and validation.
     """
-    
+
     def __init__(self):
         """Initialize the parser with empty data structures."""
-        self.nodes: Dict[int, List[float]] = {}          # {node_id: [x, y, z]}
+        # Nodes are stored struct-of-arrays: one int64 id array plus one
+        # (N, 3) float64 coordinate slab instead of a dict entry, list and
+        # three boxed floats per node. The dict-shaped `nodes` view is
+        # materialized lazily for backward compatibility.
+        self.node_ids: np.ndarray = np.empty(0, dtype=np.int64)
+        self.node_xyz: np.ndarray = np.empty((0, 3), dtype=np.float64)
+        self._node_chunks: List[Any] = []
+        self._nodes_cache: Optional[Dict[int, List[float]]] = None
+
+        # Node/element blocks queue up during the scan and are parsed at the
+        # end of the pass, in parallel when the compiled scanner is present.
+        self._block: List[bytes] = []
+        self._pending_blocks: List[Any] = []
+
         self.elements: Dict[int, Dict[str, Any]] = {}    # {element_id: {"type": type, "nodes": [node_ids]}}
         self.materials: Dict[str, Dict[str, float]] = {} # {material_name: {property: value}}
         self.sections: Dict[str, Dict[str, Any]] = {}    # {section_name: {property: value}}
-        self.boundaries: Dict[int, List[int]] = {}       # {node_id: [dof_constraints]}
-        self.loads: Dict[int, List[float]] = {}          # {node_id: [Fx, Fy, Fz, Mx, My, Mz]}
+
+        # Boundary DOF flags are pure 0/1, so each constrained node is one
+        # int8[6] row (6 bytes) instead of a list of six PyLongs.
+        self._bc_node_to_row: Dict[int, int] = {}
+        self._bc_rows: np.ndarray = np.zeros((0, 6), dtype=np.int8)
+        self._boundaries_cache: Optional[Dict[int, List[int]]] = None
+
+        # Loads live in a compact (N, 6) float64 table addressed through a
+        # node-id -> row map; the dict view is again a lazy shim.
+        self._load_node_to_row: Dict[int, int] = {}
+        self._load_rows: np.ndarray = np.zeros((0, 6), dtype=np.float64)
+        self._loads_cache: Optional[Dict[int, List[float]]] = None
+
         self.element_sets: Dict[str, List[int]] = {}     # {set_name: [element_ids]}
         self.node_sets: Dict[str, List[int]] = {}        # {set_name: [node_ids]}
         self.material_mapping: Dict[str, str] = {}       # {section_name: material_name}
-        
-        # State tracking during parsing
-        self.current_section: Optional[str] = None
+
+        # State tracking during parsing; only the material name carries
+        # across keywords (the *Elastic/*Density handlers read it)
         self.current_material: Optional[str] = None
-        self.current_elset: Optional[str] = None
-        self.current_nset: Optional[str] = None
-        
+
+        # Keyword dispatch: one dict probe on the lowercased bytes keyword
+        # replaces the old chain of equality compares per keyword line.
+        self._dispatch = {
+            b'*node': self._parse_nodes,
+            b'*material': self._parse_material,
+            b'*elastic': lambda lines, i: self._parse_material_property(lines, i, 'elastic'),
+            b'*density': lambda lines, i: self._parse_material_property(lines, i, 'density'),
+            b'*shell section': self._parse_section,
+            b'*solid section': self._parse_section,
+            b'*boundary': self._parse_boundary,
+            b'*cload': self._parse_load,
+            b'*elset': self._parse_elset,
+            b'*nset': self._parse_nset,
+        }
+
     def parse(self, inp_file_path: Union[str, Path]) -> 'AbaqusParser':
         """
         Parse the Abaqus .inp file.
-        
+
         Args:
             inp_file_path: Path to the Abaqus .inp file.
-            
+
         Returns:
             The parser instance with parsed data.
-            
+
         Raises:
             FileNotFoundError: If the input file doesn't exist.
             ValueError: If the file cannot be parsed.
         """
         file_path = Path(inp_file_path)
-        
+
         if not file_path.exists():
             raise FileNotFoundError(f"Input file not found: {file_path}")
-            
+
         logger.info(f"Parsing Abaqus file: {file_path}")
-        
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-        except UnicodeDecodeError:
-            # Try with different encoding
-            with open(file_path, 'r', encoding='latin-1') as f:
-                lines = f.readlines()
-            
+
+        # Memory-map the file and keep every line as raw bytes: the kernel
+        # pages data in on demand and nothing is decoded up front. Names are
+        # decoded individually where they are stored, so the old two-read
+        # utf-8/latin-1 fallback is gone as well. Lines are stripped exactly
+        # once here, and blank/comment lines are filtered in the same pass,
+        # so no downstream loop re-checks either condition.
+        with open(file_path, 'rb') as f:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (ValueError, OSError):
+                # Empty files (and exotic filesystems) cannot be mapped
+                lines = _clean_lines(f.read().splitlines())
+            else:
+                with mm:
+                    lines = _clean_lines(iter(mm.readline, b''))
+
         line_index = 0
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('**'):
-                line_index += 1
-                continue
-            
-            # Handle section keywords
-            if line.startswith('*'):
+            # Every remaining line is either a keyword or data
+            if lines[line_index].startswith(b'*'):
                 line_index = self._parse_keyword(lines, line_index)
             else:
                 line_index += 1
-                
-        logger.info(f"Parsing completed: {len(self.nodes)} nodes, {len(self.elements)} elements")
+
+        self._drain_blocks()
+        self._finalize_nodes()
+
+        logger.info(f"Parsing completed: {self.node_ids.size} nodes, {len(self.elements)} elements")
         return self
-    
-    def _parse_keyword(self, lines: List[str], start_index: int) -> int:
+
+    def _finalize_nodes(self) -> None:
+        """Concatenate the parsed node chunks into the SoA arrays."""
+        if self._node_chunks:
+            self.node_ids = np.concatenate([ids for ids, _ in self._node_chunks])
+            self.node_xyz = np.vstack([xyz for _, xyz in self._node_chunks])
+        self._node_chunks = []
+        self._nodes_cache = None
+
+    @property
+    def nodes(self) -> Dict[int, List[float]]:
+        """Dict view {node_id: [x, y, z]}, built lazily from the SoA arrays."""
+        if self._nodes_cache is None:
+            self._nodes_cache = dict(
+                zip(self.node_ids.tolist(), self.node_xyz.tolist())
+            )
+        return self._nodes_cache
+
+    @property
+    def boundaries(self) -> Dict[int, List[int]]:
+        """Dict view {node_id: [dof_constraints]}, built lazily."""
+        if self._boundaries_cache is None:
+            self._boundaries_cache = {
+                node_id: self._bc_rows[row].tolist()
+                for node_id, row in self._bc_node_to_row.items()
+            }
+        return self._boundaries_cache
+
+    def _bc_row(self, node_id: int) -> int:
+        """Map a node id to its boundary row, growing the table as needed."""
+        row = self._bc_node_to_row.get(node_id)
+        if row is None:
+            row = len(self._bc_node_to_row)
+            if row >= self._bc_rows.shape[0]:
+                grown = np.zeros((self._bc_rows.shape[0] + 1024, 6), dtype=np.int8)
+                grown[:row] = self._bc_rows[:row]
+                self._bc_rows = grown
+            self._bc_node_to_row[node_id] = row
+        return row
+
+    @property
+    def loads(self) -> Dict[int, List[float]]:
+        """Dict view {node_id: [Fx, Fy, Fz, Mx, My, Mz]}, built lazily."""
+        if self._loads_cache is None:
+            self._loads_cache = {
+                node_id: self._load_rows[row].tolist()
+                for node_id, row in self._load_node_to_row.items()
+            }
+        return self._loads_cache
+
+    def _load_row(self, node_id: int) -> int:
+        """Map a node id to its load row, growing the table as needed."""
+        row = self._load_node_to_row.get(node_id)
+        if row is None:
+            row = len(self._load_node_to_row)
+            if row >= self._load_rows.shape[0]:
+                # Grow in chunks to amortize reallocation
+                grown = np.zeros((self._load_rows.shape[0] + 1024, 6), dtype=np.float64)
+                grown[:row] = self._load_rows[:row]
+                self._load_rows = grown
+            self._load_node_to_row[node_id] = row
+        return row
+
+    def _parse_keyword(self, lines: List[bytes], start_index: int) -> int:
         """
         Parse a keyword section from the Abaqus file.
-        
+
         Args:
             lines: All lines in the file.
             start_index: Starting index for the keyword section.
-            
+
         Returns:
             Next line index to process.
         """
-        line = lines[start_index].strip()
-        keyword = line.split(',')[0].strip().lower()
-        
-        # Parse different keyword sections
-        if keyword == '*node':
-            return self._parse_nodes(lines, start_index)
-        elif keyword.startswith('*element'):
+        line = lines[start_index]
+        comma = line.find(b',')
+        keyword = (line if comma < 0 else line[:comma]).strip().lower()
+
+        handler = self._dispatch.get(keyword)
+        if handler is not None:
+            return handler(lines, start_index)
+
+        # *ELEMENT carries its options in the keyword field ordering, so it
+        # is matched by prefix rather than through the table
+        if keyword.startswith(b'*element'):
             return self._parse_elements(lines, start_index)
-        elif keyword == '*material':
-            return self._parse_material(lines, start_index)
-        elif keyword in ['*elastic', '*density']:
-            return self._parse_material_property(lines, start_index, keyword[1:])
-        elif keyword == '*shell section' or keyword == '*solid section':
-            return self._parse_section(lines, start_index)
-        elif keyword == '*boundary':
-            return self._parse_boundary(lines, start_index)
-        elif keyword == '*cload':
-            return self._parse_load(lines, start_index)
-        elif keyword == '*elset':
-            return self._parse_elset(lines, start_index)
-        elif keyword == '*nset':
-            return self._parse_nset(lines, start_index)
-        
+
         # Skip unknown keywords
         return start_index + 1
-    
-    def _parse_nodes(self, lines: List[str], start_index: int) -> int:
-        """Parse node definitions."""
+
+    def _collect_block(self, lines: List[bytes], start_index: int) -> int:
+        """Collect the data lines of a block into self._block."""
         line_index = start_index + 1
-        
+        block: List[bytes] = []
+
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Stop if we hit another keyword or empty line
-            if not line or line.startswith('*'):
+            line = lines[line_index]
+
+            # Stop if we hit another keyword
+            if line.startswith(b'*'):
                 break
-                
-            # Skip comments
-            if line.startswith('**'):
-                line_index += 1
-                continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 4:
-                    node_id = int(parts[0])
-                    x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
-                    self.nodes[node_id] = [x, y, z]
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse node at line {line_index + 1}: {line} - {e}")
-            
+
+            block.append(line)
             line_index += 1
-            
+
+        self._block = block
+        return line_index
+
+    def _parse_nodes(self, lines: List[bytes], start_index: int) -> int:
+        """Queue a node block for deferred parsing."""
+        line_index = self._collect_block(lines, start_index)
+        if self._block:
+            self._pending_blocks.append(('nodes', None, start_index, self._block))
         return line_index
-    
-    def _parse_elements(self, lines: List[str], start_index: int) -> int:
-        """Parse element definitions."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
+
+    def _parse_elements(self, lines: List[bytes], start_index: int) -> int:
+        """Queue an element block for deferred parsing."""
+        line = lines[start_index]
+
         # Extract element type
-        element_type = None
-        for part in parts:
-            if part.strip().lower().startswith('type='):
-                element_type = part.strip().split('=')[1].strip()
-                break
-        
+        type_bytes = _kvs(line).get(b'type')
+        element_type = sys.intern(type_bytes.decode('latin-1')) if type_bytes else None
+
         if not element_type:
-            logger.warning(f"No element type found in line: {line}")
+            logger.warning(f"No element type found in line: {line.decode('latin-1')}")
             return start_index + 1
-        
-        line_index = start_index + 1
-        while line_index < len(lines):
-            line = lines[line_index].strip()
-            
-            # Stop if we hit another keyword or empty line
-            if not line or line.startswith('*'):
-                break
-                
-            # Skip comments
-            if line.startswith('**'):
-                line_index += 1
+
+        line_index = self._collect_block(lines, start_index)
+        if self._block:
+            self._pending_blocks.append(
+                ('elements', element_type, start_index, self._block)
+            )
+        return line_index
+
+    @staticmethod
+    def _parse_block(pending):
+        """Parse one queued block; runs on a worker thread."""
+        kind, _, start_index, block = pending
+
+        arr = _scan_block(block)
+        if kind == 'nodes':
+            if arr is not None and arr.shape[1] >= 4:
+                return (arr[:, 0].astype(np.int64), np.ascontiguousarray(arr[:, 1:4]))
+
+            # Ragged or malformed block: fall back to per-line parsing
+            ids: List[int] = []
+            coords: List[List[float]] = []
+            for offset, line in enumerate(block):
+                try:
+                    parts = [part.strip() for part in line.split(b',')]
+                    if len(parts) >= 4:
+                        # Parse the whole line before storing anything so a
+                        # bad coordinate cannot desync ids from coords
+                        node_id = int(parts[0])
+                        xyz = [float(parts[1]), float(parts[2]), float(parts[3])]
+                        ids.append(node_id)
+                        coords.append(xyz)
+                except (ValueError, IndexError) as e:
+                    logger.warning(
+                        f"Failed to parse node at line {start_index + 2 + offset}: "
+                        f"{line.decode('latin-1')} - {e}"
+                    )
+            if not ids:
+                return None
+            return (np.asarray(ids, dtype=np.int64), np.asarray(coords, dtype=np.float64))
+
+        if arr is not None and arr.shape[1] >= 2:
+            arr = arr.astype(np.int64)
+            return list(zip(arr[:, 0].tolist(), arr[:, 1:].tolist()))
+
+        # Ragged block (multi-line connectivity etc.): per-line regex path
+        rows = []
+        for offset, line in enumerate(block):
+            tokens = _INT_RE.findall(line)
+            if len(tokens) >= 2:
+                rows.append((int(tokens[0]), list(map(int, tokens[1:]))))
+            else:
+                logger.warning(
+                    f"Failed to parse element at line {start_index + 2 + offset}: "
+                    f"{line.decode('latin-1')}"
+                )
+        return rows
+
+    def _drain_blocks(self) -> None:
+        """Parse the queued node/element blocks, in parallel when possible."""
+        pending = self._pending_blocks
+        self._pending_blocks = []
+
+        if len(pending) > 1 and (_parser_core or _fastparse) is not None:
+            # Blocks are independent and the compiled scanner runs without
+            # the GIL, so threads scale with cores
+            with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                results = list(executor.map(self._parse_block, pending))
+        else:
+            results = [self._parse_block(block) for block in pending]
+
+        # Dict and chunk-list writes stay on the calling thread
+        for (kind, element_type, _, _), result in zip(pending, results):
+            if result is None:
                 continue
-            
-            try:
-                parts = [part.strip() for part in line.split(',')]
-                if len(parts) >= 2:
-                    element_id = int(parts[0])
-                    node_ids = [int(parts[i]) for i in range(1, len(parts))]
+            if kind == 'nodes':
+                self._node_chunks.append(result)
+            else:
+                for element_id, node_ids in result:
                     self.elements[element_id] = {
                         'type': element_type,
                         'nodes': node_ids
                     }
-            except (ValueError, IndexError) as e:
-                logger.warning(f"Failed to parse element at line {line_index + 1}: {line} - {e}")
-            
-            line_index += 1
-            
-        return line_index
-    
-    def _parse_material(self, lines: List[str], start_index: int) -> int:
-    def _parse_material(self, lines: List[str], start_index: int) -> int:
+
+    def _parse_material(self, lines: List[bytes], start_index: int) -> int:
         """Parse material definition."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        material_name = None
-        for part in parts:
-            if part.strip().lower().startswith('name='):
-                material_name = part.split('=')[1].strip()
-                break
-        
-        if material_name:
-            self.current_material = material_name
-            if material_name not in self.materials:
-                self.materials[material_name] = {}
-        
-        return start_index + 1
-        
+        line = lines[start_index]
+
+        name_bytes = _kvs(line).get(b'name')
+        material_name = sys.intern(name_bytes.decode('latin-1')) if name_bytes else None
+
         if material_name:
             self.current_material = material_name
-            self.materials[material_name] = {}
-            
+            self.materials.setdefault(material_name, {})
+
         return start_index + 1
-    
+
     def _parse_material_property(self, lines, start_index, property_type):
         """Parse material properties like elastic, density, etc."""
         if not self.current_material:
             return start_index + 1
-            
+
         line_index = start_index + 1
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            if not line or line.startswith('*') or line.startswith('**'):
+            line = lines[line_index]
+            if line.startswith(b'*'):
                 break
-                
-            parts = line.split(',')
+
+            parts = line.split(b',')
             if property_type.lower() == 'elastic' and len(parts) >= 2:
                 self.materials[self.current_material]['E'] = float(parts[0].strip())
                 self.materials[self.current_material]['nu'] = float(parts[1].strip())
             elif property_type.lower() == 'density' and len(parts) >= 1:
                 self.materials[self.current_material]['rho'] = float(parts[0].strip())
-                
+
             line_index += 1
-            
+
         return line_index
-    
+
     def _parse_section(self, lines, start_index):
         """Parse section definitions."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        section_name = None
-        material_name = None
+        line = lines[start_index]
+
+        # Section and material names were historically lowercased here; keep
+        # that by matching against the lowered line
+        attrs = _kvs(line.lower())
+        elset_bytes = attrs.get(b'elset')
+        material_bytes = attrs.get(b'material')
+        section_name = sys.intern(elset_bytes.decode('latin-1')) if elset_bytes else None
+        material_name = sys.intern(material_bytes.decode('latin-1')) if material_bytes else None
         thickness = None
-        
-        for part in parts:
-            key_value = part.strip().lower().split('=')
-            if len(key_value) == 2:
-                key, value = key_value
-                if key == 'elset':
-                    section_name = value
-                elif key == 'material':
-                    material_name = value
-        
+
         line_index = start_index + 1
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            if not line or line.startswith('*') or line.startswith('**'):
+            line = lines[line_index]
+            if line.startswith(b'*'):
                 break
-                
-            parts = line.split(',')
+
+            parts = line.split(b',')
             if len(parts) >= 1:
                 thickness = float(parts[0].strip())
-                
+
             line_index += 1
-        
+
         if section_name and material_name:
             self.sections[section_name] = {"material": material_name}
             if thickness is not None:
                 self.sections[section_name]["thickness"] = thickness
             self.material_mapping[section_name] = material_name
-            
+
         return line_index
-    
+
     def _parse_boundary(self, lines, start_index):
         """Parse boundary condition definitions."""
         line_index = start_index + 1
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            if not line or line.startswith('*') or line.startswith('**'):
+            line = lines[line_index]
+            if line.startswith(b'*'):
                 break
-                
-            parts = line.split(',')
+
+            parts = line.split(b',')
             if len(parts) >= 3:
                 node_id = int(parts[0])
                 first_dof = int(parts[1])
@@ -300,114 +499,98 @@ class AbaqusParser:
                 value = 0.0
                 if len(parts) >= 4 and parts[3].strip():
                     value = float(parts[3])
-                    
-                if node_id not in self.boundaries:
-                    # Initialize with free DOFs
-                    self.boundaries[node_id] = [0, 0, 0, 0, 0, 0]
-                    
-                # Mark constrained DOFs (1 = fixed, 0 = free)
-                for dof in range(first_dof-1, last_dof):
-                    if dof < 6:  # Ensure we don't exceed 6 DOFs
-                        self.boundaries[node_id][dof] = 1
-                
+
+                # Mark the constrained DOF range (1 = fixed, 0 = free) with
+                # a single slice store instead of a per-DOF loop
+                row = self._bc_row(node_id)
+                self._bc_rows[row, max(first_dof, 1) - 1:min(last_dof, 6)] = 1
+                self._boundaries_cache = None
+
             line_index += 1
-            
+
         return line_index
-    
+
     def _parse_load(self, lines, start_index):
         """Parse load definitions."""
         line_index = start_index + 1
         while line_index < len(lines):
-            line = lines[line_index].strip()
-            if not line or line.startswith('*') or line.startswith('**'):
+            line = lines[line_index]
+            if line.startswith(b'*'):
                 break
-                
-            parts = line.split(',')
+
+            parts = line.split(b',')
             if len(parts) >= 3:
                 node_id = int(parts[0])
                 dof = int(parts[1])
                 value = float(parts[2])
-                
-                if node_id not in self.loads:
-                    # Initialize with zero loads
-                    self.loads[node_id] = [0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
-                    
+
                 # Apply load at the specified DOF (1-indexed in Abaqus)
                 if 1 <= dof <= 6:
-                    self.loads[node_id][dof-1] = value
-                
+                    row = self._load_row(node_id)
+                    self._load_rows[row, dof-1] = value
+                    self._loads_cache = None
+
             line_index += 1
-            
+
         return line_index
-    
+
+    @staticmethod
+    def _extend_set(ids: List[int], line: bytes, generate: bool) -> None:
+        """Add one set data line's ids, expanding GENERATE range triplets."""
+        tokens = list(map(int, _INT_RE.findall(line)))
+        if generate and len(tokens) >= 2:
+            step = tokens[2] if len(tokens) > 2 else 1
+            # range() gives the exact final length in one allocation
+            ids.extend(range(tokens[0], tokens[1] + 1, step))
+        else:
+            ids.extend(tokens)
+
     def _parse_elset(self, lines, start_index):
         """Parse element set definitions."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        set_name = None
-        for part in parts:
-            if part.strip().lower().startswith('elset='):
-                set_name = part.split('=')[1].strip()
-                break
-        
+        line = lines[start_index]
+
+        name_bytes = _kvs(line).get(b'elset')
+        set_name = sys.intern(name_bytes.decode('latin-1')) if name_bytes else None
+
         if set_name:
-            self.current_elset = set_name
+            generate = _has_generate(line)
             self.element_sets[set_name] = []
-            
+
             line_index = start_index + 1
             while line_index < len(lines):
-                line = lines[line_index].strip()
-                if not line or line.startswith('*') or line.startswith('**'):
+                line = lines[line_index]
+                if line.startswith(b'*'):
                     break
-                    
-                parts = line.split(',')
-                for part in parts:
-                    if part.strip():
-                        try:
-                            element_id = int(part.strip())
-                            self.element_sets[set_name].append(element_id)
-                        except ValueError:
-                            pass
-                    
+
+                self._extend_set(self.element_sets[set_name], line, generate)
+
                 line_index += 1
-                
+
             return line_index
-        
+
         return start_index + 1
-    
+
     def _parse_nset(self, lines, start_index):
         """Parse node set definitions."""
-        line = lines[start_index].strip()
-        parts = line.split(',')
-        
-        set_name = None
-        for part in parts:
-            if part.strip().lower().startswith('nset='):
-                set_name = part.split('=')[1].strip()
-                break
-        
+        line = lines[start_index]
+
+        name_bytes = _kvs(line).get(b'nset')
+        set_name = sys.intern(name_bytes.decode('latin-1')) if name_bytes else None
+
         if set_name:
-            self.current_nset = set_name
+            generate = _has_generate(line)
             self.node_sets[set_name] = []
-            
+
             line_index = start_index + 1
             while line_index < len(lines):
-                line = lines[line_index].strip()
-                if not line or line.startswith('*') or line.startswith('**'):
+                line = lines[line_index]
+                if line.startswith(b'*'):
                     break
-                    
-                parts = line.split(',')
-                for part in parts:
-                    if part.strip():
-                        try:
-                            node_id = int(part.strip())
-                            self.node_sets[set_name].append(node_id)
-                        except ValueError:
-                            pass
-                    
+
+                self._extend_set(self.node_sets[set_name], line, generate)
+
                 line_index += 1
-                
+
             return line_index
-        
-        return start_index + 1
\ No newline at end of file
+
+        return start_index + 1
@@ -3,9 +3,27 @@
 Setup script for PySeesAbq.
 
 This file is required for editable installs with pip install -e .
+
+It also wires in the optional Cython parser core: when Cython (and NumPy
+headers) are available the compiled tokenizer extension is built, otherwise
+the install stays pure-Python and the parser falls back to its Numba or
+NumPy paths at runtime.
 """
 
 from setuptools import setup
 
+try:
+    import numpy
+    from Cython.Build import cythonize
+
+    ext_modules = cythonize(
+        ["pyseesabq/_parser_core.pyx"],
+        compiler_directives={"language_level": 3},
+    )
+    include_dirs = [numpy.get_include()]
+except ImportError:
+    ext_modules = []
+    include_dirs = []
+
 if __name__ == "__main__":
-    setup()
+    setup(ext_modules=ext_modules, include_dirs=include_dirs)
@@ -0,0 +1,89 @@
+"""
+Tests for the command-line interface.
+"""
+import unittest
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from click.testing import CliRunner
+
+from pyseesabq.cli import cli
+
+
+def setUpModule():
+    # Route the on-disk parse cache to a throwaway directory so test runs
+    # never write into the user's real cache
+    global _cache_tmp, _saved_xdg
+    _cache_tmp = tempfile.mkdtemp()
+    _saved_xdg = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = _cache_tmp
+
+
+def tearDownModule():
+    if _saved_xdg is None:
+        os.environ.pop('XDG_CACHE_HOME', None)
+    else:
+        os.environ['XDG_CACHE_HOME'] = _saved_xdg
+    shutil.rmtree(_cache_tmp, ignore_errors=True)
+
+SAMPLE_INP = b"""**
+** Sample Abaqus input file for testing
+**
+*Node
+1, 0.0, 0.0, 0.0
+2, 10.0, 0.0, 0.0
+3, 10.0, 10.0, 0.0
+4, 0.0, 10.0, 0.0
+*Element, type=S4R
+1, 1, 2, 3, 4
+*Material, name=Steel
+*Elastic
+210000.0, 0.3
+*Density
+7.85e-9
+*Shell Section, elset=AllElements, material=Steel
+0.01
+*Elset, elset=AllElements
+1
+*Boundary
+1, 1, 6, 0.0
+2, 1, 6, 0.0
+*Cload
+4, 3, -1000.0
+"""
+
+
+class TestBatchCommand(unittest.TestCase):
+    """Test cases for the batch conversion command."""
+
+    def setUp(self):
+        self.runner = CliRunner()
+        self.input_dir = Path(tempfile.mkdtemp())
+        for name in ('model_a.inp', 'model_b.inp'):
+            (self.input_dir / name).write_bytes(SAMPLE_INP)
+
+    def tearDown(self):
+        shutil.rmtree(self.input_dir, ignore_errors=True)
+
+    def _run_batch(self, *extra_args):
+        result = self.runner.invoke(
+            cli, ['batch', str(self.input_dir), '--overwrite', *extra_args]
+        )
+        self.assertEqual(result.exit_code, 0, result.output)
+        self.assertIn('Successful: 2', result.output)
+        for name in ('model_a.py', 'model_b.py'):
+            self.assertTrue((self.input_dir / name).exists())
+
+    def test_batch_serial(self):
+        """Test serial batch conversion (-j 1)."""
+        self._run_batch('-j', '1')
+
+    def test_batch_parallel(self):
+        """Test parallel batch conversion over a process pool (-j 2)."""
+        self._run_batch('-j', '2')
+
+
+if __name__ == '__main__':
+    unittest.main()
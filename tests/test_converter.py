@@ -3,10 +3,29 @@ Tests for the Abaqus to OpenSeesPy converter module.
 """
 import unittest
 import os
+import shutil
 import tempfile
 from pyseesabq.parser import AbaqusParser
 from pyseesabq.converter import AbaqusToOpenSeesConverter, convert
 
+
+def setUpModule():
+    # Route the on-disk parse cache to a throwaway directory so test runs
+    # never write into the user's real cache
+    global _cache_tmp, _saved_xdg
+    _cache_tmp = tempfile.mkdtemp()
+    _saved_xdg = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = _cache_tmp
+
+
+def tearDownModule():
+    if _saved_xdg is None:
+        os.environ.pop('XDG_CACHE_HOME', None)
+    else:
+        os.environ['XDG_CACHE_HOME'] = _saved_xdg
+    shutil.rmtree(_cache_tmp, ignore_errors=True)
+
+
 class TestAbaqusToOpenSeesConverter(unittest.TestCase):
     """Test cases for the AbaqusToOpenSeesConverter class."""
     
@@ -3,8 +3,31 @@ Tests for the Abaqus parser module.
 """
 import unittest
 import os
+import shutil
 import tempfile
-from pyseesabq.parser import AbaqusParser
+
+import numpy as np
+
+from pyseesabq.parser import AbaqusParser, parse_cached
+from pyseesabq.parser_old import AbaqusParser as LegacyAbaqusParser
+
+
+def setUpModule():
+    # Route the on-disk parse cache to a throwaway directory so test runs
+    # never write into the user's real cache
+    global _cache_tmp, _saved_xdg
+    _cache_tmp = tempfile.mkdtemp()
+    _saved_xdg = os.environ.get('XDG_CACHE_HOME')
+    os.environ['XDG_CACHE_HOME'] = _cache_tmp
+
+
+def tearDownModule():
+    if _saved_xdg is None:
+        os.environ.pop('XDG_CACHE_HOME', None)
+    else:
+        os.environ['XDG_CACHE_HOME'] = _saved_xdg
+    shutil.rmtree(_cache_tmp, ignore_errors=True)
+
 
 class TestAbaqusParser(unittest.TestCase):
     """Test cases for the AbaqusParser class."""
@@ -82,11 +105,141 @@ class TestAbaqusParser(unittest.TestCase):
         self.assertTrue(2 in self.parser.boundaries)
         self.assertEqual(self.parser.boundaries[1], [1, 1, 1, 1, 1, 1])
     
+    def test_parse_node_coordinates_exact(self):
+        """Test that parsed coordinates match float() to the last bit."""
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix='.inp')
+        # Non-dyadic decimals catch scanners that round differently from
+        # float()/strtod
+        temp.write(b"*Node\n1, 0.3, 0.7, 1.1\n2, 7.85e-9, -0.1, 123456789.123456\n")
+        temp.close()
+        try:
+            parser = AbaqusParser()
+            parser.parse(temp.name)
+            self.assertEqual(parser.nodes[1], [0.3, 0.7, 1.1])
+            self.assertEqual(parser.nodes[2], [7.85e-9, -0.1, 123456789.123456])
+        finally:
+            os.unlink(temp.name)
+
+    def test_parse_unchanged_file_twice(self):
+        """Test that re-parsing an unchanged file populates a fresh parser."""
+        self.parser.parse(self.temp_file.name)
+        # The second parse may be served from the on-disk cache; the parser
+        # instance it is called on must still end up populated
+        second = AbaqusParser()
+        second.parse(self.temp_file.name)
+        self.assertEqual(len(second.nodes), 4)
+        self.assertEqual(second.nodes[1], [0.0, 0.0, 0.0])
+        self.assertEqual(second.elements[1]['nodes'], [1, 2, 3, 4])
+
     def test_parse_loads(self):
         """Test parsing of loads."""
         self.parser.parse(self.temp_file.name)
         self.assertTrue(4 in self.parser.loads)
         self.assertEqual(self.parser.loads[4][2], -1000.0)  # Z-direction load
 
+class TestParserApi(unittest.TestCase):
+    """Test cases for the newer parser API surface."""
+
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.inp')
+        self.temp_file.write(b"""*Node
+10, 0.0, 0.0, 0.0
+2, 10.0, 0.0, 0.0
+7, 10.0, 10.0, 0.0
+""")
+        self.temp_file.close()
+
+    def tearDown(self):
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+
+    def test_parse_cached_shares_instance(self):
+        """Test that parse_cached returns the same instance for an unchanged file."""
+        first = parse_cached(self.temp_file.name)
+        second = parse_cached(self.temp_file.name)
+        self.assertIs(first, second)
+        self.assertEqual(len(first.nodes), 3)
+
+    def test_parse_cached_reparses_on_change(self):
+        """Test that parse_cached sees a rewritten file as a new entry."""
+        first = parse_cached(self.temp_file.name)
+        with open(self.temp_file.name, 'ab') as f:
+            f.write(b"4, 0.0, 10.0, 0.0\n")
+        second = parse_cached(self.temp_file.name)
+        self.assertIsNot(first, second)
+        self.assertEqual(len(second.nodes), 4)
+
+    def test_high_precision_flag(self):
+        """Test the float32 storage mode against the float64 default."""
+        parser = AbaqusParser(high_precision=False, use_cache=False)
+        parser.parse(self.temp_file.name)
+        self.assertEqual(parser.node_coords.dtype, np.float32)
+
+        default_parser = AbaqusParser(use_cache=False)
+        default_parser.parse(self.temp_file.name)
+        self.assertEqual(default_parser.node_coords.dtype, np.float64)
+
+    def test_cache_dir_bounded(self):
+        """Test that the disk cache evicts its oldest entries past the bound."""
+        from pyseesabq.parser import _CACHE_MAX_ENTRIES, _cache_dir, _prune_cache
+        cache_dir = _cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        for i in range(_CACHE_MAX_ENTRIES + 5):
+            (cache_dir / f"fake{i:03d}.pkl").write_bytes(b"x")
+        _prune_cache(cache_dir)
+        self.assertLessEqual(
+            len(list(cache_dir.glob('*.pkl'))), _CACHE_MAX_ENTRIES
+        )
+
+    def test_node_row(self):
+        """Test the binary-search row lookup over unsorted node ids."""
+        parser = AbaqusParser(use_cache=False)
+        parser.parse(self.temp_file.name)
+        for node_id in (10, 2, 7):
+            row = parser.node_row(node_id)
+            self.assertEqual(int(parser.node_ids[row]), node_id)
+            self.assertEqual(parser.node_coords[row].tolist(), parser.nodes[node_id])
+        with self.assertRaises(KeyError):
+            parser.node_row(99)
+
+
+class TestSetGenerate(unittest.TestCase):
+    """Test cases for *Elset/*Nset GENERATE handling in both parsers."""
+
+    def setUp(self):
+        self.temp_file = tempfile.NamedTemporaryFile(delete=False, suffix='.inp')
+        self.temp_file.write(b"""*Elset, elset=EveryOther, generate
+1, 9, 2
+*Elset, elset=Plain
+1, 1, 2
+*Nset, nset=Range, GENERATE
+10, 12
+*Nset, nset=regenerate_zone
+1, 1
+""")
+        self.temp_file.close()
+
+    def tearDown(self):
+        if os.path.exists(self.temp_file.name):
+            os.unlink(self.temp_file.name)
+
+    def _check_sets(self, parsed):
+        self.assertEqual(parsed.element_sets['EveryOther'], [1, 3, 5, 7, 9])
+        # A set without GENERATE keeps its literal ids
+        self.assertEqual(parsed.element_sets['Plain'], [1, 1, 2])
+        # A missing step defaults to 1
+        self.assertEqual(parsed.node_sets['Range'], [10, 11, 12])
+        # GENERATE must match as an option token, not as a substring of
+        # the set name
+        self.assertEqual(parsed.node_sets['regenerate_zone'], [1, 1])
+
+    def test_generate_sets(self):
+        """Test GENERATE range expansion in the streaming parser."""
+        self._check_sets(AbaqusParser().parse(self.temp_file.name))
+
+    def test_generate_sets_legacy(self):
+        """Test GENERATE range expansion in the legacy parser."""
+        self._check_sets(LegacyAbaqusParser().parse(self.temp_file.name))
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file